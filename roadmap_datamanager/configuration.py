@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import copy
+import functools
 import json
+import logging
 import os
 
 from datetime import datetime
@@ -17,15 +20,53 @@ try:
 except ImportError:
     user_config_dir = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 T = TypeVar("T")
 
+_LOG = logging.getLogger(__name__)
+
+# config file path -> (st_mtime_ns, st_size, parsed JSON) of the last read or write, see load_config
+_CFG_CACHE: dict[Path, tuple[int, int, Any]] = {}
+
 
 class ConfigError(Exception):
     pass
 
 
-@dataclass
+def _json_loads(payload: bytes) -> Any:
+    """
+    Parses JSON from bytes. Uses orjson if it is installed, which parses several times faster than the json module.
+    orjson.JSONDecodeError is a subclass of json.JSONDecodeError, so callers catch either with the latter.
+    :param payload: (bytes) the JSON document
+    :return: the parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serializes obj to indented JSON bytes. Uses orjson if it is installed, which serializes several times faster than
+    the json module; both produce an indent of 2.
+    :param obj: JSON-serializable object
+    :return: (bytes) the JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson.JSONEncodeError, e.g. for non-str keys, which the json module converts
+            pass
+    return json.dumps(obj, indent=2).encode()
+
+
+@dataclass(slots=True)
 class BaseConfig:
     CONFIG_ENV_VAR: ClassVar[str] = "DEFAULT_CONFIG"
     CONFIG_APP_NAME: ClassVar[str] = "default"
@@ -67,6 +108,12 @@ class BaseConfig:
     # Datamanager root directory
     dm_root: str = None
 
+    # GUI: browse with Qt's QFileSystemModel instead of the lazy, paginated directory model. QFileSystemModel stats
+    # every entry of a directory and is only advisable on fast local disks.
+    use_qt_file_system_model: bool = False
+    # GUI: use the operating system's folder picker instead of Qt's own dialog, which stats every listed entry
+    use_native_file_dialog: bool = True
+
 
 def _filter_to_dataclass_fields(data: dict[str, Any], config_cls: Type[T]) -> dict[str, Any]:
     result: dict[str, Any] = {}
@@ -153,16 +200,30 @@ def default_config_path(
     :param fallback_dirname: the fallback directory name under the user home directory
     :return: path to the default config file
     """
+    # the environment variable is checked on every call, so that it can be changed at runtime (e.g. by tests)
     if env_var:
         override = os.getenv(env_var)
         if override:
             return Path(override).expanduser()
 
+    return _default_config_dir(app_name, app_author, fallback_dirname) / filename
+
+
+@functools.lru_cache(maxsize=8)
+def _default_config_dir(app_name: str, app_author: str, fallback_dirname: str | None) -> Path:
+    """
+    Resolves the per-user config directory, via platformdirs if available. Cached, as the platform lookup does not
+    change during the lifetime of the process.
+    :param app_name: the name of the app that saves the configuration
+    :param app_author: the app author (i.e. streamlit, pyside)
+    :param fallback_dirname: the fallback directory name under the user home directory
+    :return: path to the config directory
+    """
     if user_config_dir:
-        return Path(user_config_dir(app_name, app_author)) / filename
+        return Path(user_config_dir(app_name, app_author))
 
     fallback = fallback_dirname or f".{app_name}"
-    return Path.home() / fallback / filename
+    return Path.home() / fallback
 
 
 def load_config(
@@ -192,14 +253,32 @@ def load_config(
         filename=filename,
         fallback_dirname=fallback_dirname,
     )
-    if not cfg_path.exists():
-        return config_cls()
-
     try:
-        raw = json.loads(cfg_path.read_text())
-    except (json.JSONDecodeError, OSError, NotADirectoryError):
+        st = cfg_path.stat()
+    except OSError:
         return config_cls()
 
+    # the file is only parsed again if it changed since it was last read or written
+    cached = _CFG_CACHE.get(cfg_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        raw = copy.deepcopy(cached[2])
+    else:
+        try:
+            payload = cfg_path.read_bytes()
+        except OSError as e:
+            _LOG.warning("config unreadable at %s: %s", cfg_path, e)
+            return config_cls()
+        # an empty file (e.g. truncated by a crash) needs no parser call
+        if not payload.strip():
+            return config_cls()
+        try:
+            raw = _json_loads(payload)
+        except ValueError as e:
+            # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
+            _LOG.warning("config unreadable at %s: %s", cfg_path, e)
+            return config_cls()
+        _CFG_CACHE[cfg_path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(raw))
+
     if not isinstance(raw, dict):
         return config_cls()
 
@@ -241,13 +320,25 @@ def save_config(
         data = asdict(data)
 
     safe_data = _make_json_safe(data)
-    cfg_path.write_text(json.dumps(safe_data, indent=2))
+    payload = _json_dumps(safe_data)
+    try:
+        unchanged = cfg_path.read_bytes() == payload
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        # write to a temporary file and rename it into place, so that the config file is never left half-written
+        tmp_path = cfg_path.with_suffix(cfg_path.suffix + ".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, cfg_path)
+    st = cfg_path.stat()
+    # cache what a read would return, e.g. lists where data had tuples
+    _CFG_CACHE[cfg_path] = (st.st_mtime_ns, st.st_size, _json_loads(payload))
     return cfg_path
 
 
 # Datmanager specific implementation, might be moved to different file in future
 
-@dataclass
+@dataclass(slots=True)
 class DataManagerConfig(BaseConfig):
     CONFIG_ENV_VAR: ClassVar[str] = "ROADMAP_DM_CONFIG"
     CONFIG_APP_NAME: ClassVar[str] = "roadmap-datamanager"
@@ -3,7 +3,10 @@ from __future__ import annotations
 from datalad import api as dl
 from datalad.api import Dataset
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
 from pathlib import Path
+import re
 import shutil
 import subprocess
 import shlex
@@ -13,14 +16,35 @@ import os
 from roadmap_datamanager import metadata as md
 
 
-def _run_git(args: list[str], *, cwd: str | Path | os.PathLike) -> subprocess.CompletedProcess:
+# Path component of the targets of locked annexed files (symlinks into .git/annex/objects)
+_ANNEX_OBJECTS = 'annex/objects/'
+
+# Max. number of paths passed to a single git-annex call, to stay well below command line length limits
+_ANNEX_PATH_BATCH = 512
+
+# Max. number of datasets whose annexed content is copied to a sibling concurrently
+_ANNEX_COPY_WORKERS = 4
+
+# Max. number of concurrent `git ls-remote` calls when checking a dataset tree for remote changes
+_LS_REMOTE_WORKERS = 8
+
+# Lets concurrent ssh connections to the same host share one TCP connection. Only set if the user has not configured
+# GIT_SSH_COMMAND, and not on Windows, whose OpenSSH does not support connection multiplexing.
+_SSH_MULTIPLEX_COMMAND = "ssh -o ControlMaster=auto -o ControlPath=~/.ssh/cm-%r@%h:%p -o ControlPersist=60"
+
+
+def _run_git(args: list[str], *, cwd: str | Path | os.PathLike,
+             extra_env: dict[str, str] | None = None) -> subprocess.CompletedProcess:
     """
     Run a git command in `cwd` without changing the process working directory.
     """
-    env = os.environ.copy()
     # We previously had an option to modify the environment via the config -> reintroduce if ever needed
     # env.update(self.cfg.env)
-    env.setdefault("GIT_TERMINAL_PROMPT", "0")
+    # variables are only added if not set in the process environment; if none is missing, the child inherits the
+    # environment (env=None) instead of receiving a copy of it
+    overlay = {"GIT_TERMINAL_PROMPT": "0", **(extra_env or {})}
+    missing = {key: value for key, value in overlay.items() if key not in os.environ}
+    env = {**os.environ, **missing} if missing else None
 
     return subprocess.run(
         ["git", *args],
@@ -32,9 +56,43 @@ def _run_git(args: list[str], *, cwd: str | Path | os.PathLike) -> subprocess.Co
     )
 
 
+def _is_up_to_date_with_remote(dataset: Path, sibling_name: str) -> bool:
+    """
+    Checks with a single `git ls-remote` whether pulling from a sibling would change a dataset, i.e. whether the
+    remote HEAD is already contained in the local HEAD and the remote git-annex branch equals the last fetched one.
+    :param dataset: (Path) root of the installed dataset
+    :param sibling_name: (str) name of the sibling (git remote)
+    :return: (bool) True if the dataset is up to date, False if it needs a pull or the remote could not be queried
+    """
+    extra_env = {"GIT_SSH_COMMAND": _SSH_MULTIPLEX_COMMAND} if os.name == "posix" else None
+    res = _run_git(["ls-remote", "--exit-code", sibling_name, "HEAD", "refs/heads/git-annex"], cwd=dataset,
+                   extra_env=extra_env)
+    if res.returncode != 0:
+        return False
+    refs = {}
+    for line in res.stdout.splitlines():
+        sha, _, ref = line.partition("\t")
+        refs[ref.strip()] = sha.strip()
+
+    remote_head = refs.get("HEAD")
+    if not remote_head:
+        return False
+    # fails as well if the commit is not present locally
+    if _run_git(["merge-base", "--is-ancestor", remote_head, "HEAD"], cwd=dataset).returncode != 0:
+        return False
+
+    remote_annex = refs.get("refs/heads/git-annex")
+    if remote_annex:
+        local_annex = _run_git(["rev-parse", "--verify", "-q", f"refs/remotes/{sibling_name}/git-annex"], cwd=dataset)
+        if local_annex.stdout.strip() != remote_annex:
+            return False
+    return True
+
+
 def _resolve_sibling_name(dataset: str | os.PathLike,
                           sibling_name: str | None = None,
-                          recursive: bool = False) -> str | None:
+                          recursive: bool = False,
+                          sibs: list[dict] | None = None) -> str | None:
     """
     Determine the sibling name to use for pull/push operations.
     If `sibling_name` is given, return it unchanged. Otherwise, prefer 'gin',
@@ -42,13 +100,16 @@ def _resolve_sibling_name(dataset: str | os.PathLike,
     :param dataset: (str or os.PathLike) the dataset containing the sibling(s)
     :param sibling_name: (str or None) sibling name to use, defaults to None
     :param recursive: (bool) whether to recurse into siblings, defaults to False
+    :param sibs: (list[dict] or None) result of a siblings query with the same recursive setting, if the caller
+                 already has it; queried otherwise
     :return: sibling name
     """
     if sibling_name is not None:
         return sibling_name
 
-    ds = Dataset(str(Path(dataset).expanduser().resolve()))
-    sibs = ds.siblings(action="query", return_type="list", recursive=recursive)
+    if sibs is None:
+        ds = Dataset(str(Path(dataset).expanduser().resolve()))
+        sibs = ds.siblings(action="query", return_type="list", recursive=recursive)
     names = [s["name"] for s in sibs if s.get("name")]
     if "gin" in names:
         return "gin"
@@ -61,7 +122,8 @@ def clone_from_remote(dest: str | os.PathLike,
                       source_url: str = None,
                       source_url_root: str = None,
                       user_name: str = None,
-                      repo_name: str = None):
+                      repo_name: str = None,
+                      lean: bool = False):
     """
     Clone a superdataset from GIN into dest, install subdatasets (no data),
     normalize all GIN remotes to the sibling name 'gin', and remove 'origin'.
@@ -74,12 +136,17 @@ def clone_from_remote(dest: str | os.PathLike,
     :param source_url_root: (str) URL root of the GIN dataset to clone, defaults to None
     :param user_name: (str) GIN unser name for the repository, defaults to None
     :param repo_name: (str) repo name of the repository, defaults to None
+    :param lean: (bool) clone only the latest commit of the default branch (plus the git-annex branch) of the
+                 superdataset instead of its full history, defaults to False
     :return: no return value
     """
 
     dest: Path = Path(dest).expanduser().resolve()
-    dest.mkdir(parents=True, exist_ok=True)
-    if any(dest.iterdir()):
+    os.makedirs(dest, exist_ok=True)
+    # stops at the first entry, without creating Path objects
+    with os.scandir(dest) as entries:
+        not_empty = next(entries, None) is not None
+    if not_empty:
         raise RuntimeError(f"Destination path {dest} must be empty.")
 
     if source_url is None:
@@ -94,7 +161,13 @@ def clone_from_remote(dest: str | os.PathLike,
 
         source_url = f"{source_url_root}/{user_name}/{repo_name}.git"
 
-    dl.clone(source=source_url, path=str(dest))
+    if lean:
+        dl.clone(source=source_url, path=str(dest), git_clone_opts=['--depth=1', '--single-branch'])
+        # --single-branch leaves out the git-annex branch, which annex needs to locate content on the remote
+        _ = _run_git(["fetch", "--depth", "1", "origin", "+refs/heads/git-annex:refs/remotes/origin/git-annex"],
+                     cwd=dest)
+    else:
+        dl.clone(source=source_url, path=str(dest))
 
     # installs subdatasets
     pull_from_remotes(dataset=str(dest), recursive=True)
@@ -131,12 +204,13 @@ def create_dataset(dataset, path=None):
     dl.create(dataset=dataset, path=path, cfg_proc="text2git")
 
 
-def drop_content(dataset: str | os.PathLike, path: str | os.PathLike = None, recursive: bool = False) -> None:
+def drop_content(dataset: str | os.PathLike, path: str | os.PathLike | list[str | os.PathLike] | None = None,
+                 recursive: bool = False) -> None:
     """
     Drop local annexed content after confirming availability elsewhere.
     :param dataset: (str, os.Pathlike) path to the dataset for which to drop local content
-    :param path: (str, os.Pathlike) relative or absolute path to the dataset component for which to drop local
-                 content, defaults to None which will drop all components of the dataset
+    :param path: (str, os.Pathlike, list) relative or absolute path(s) to the dataset component(s) for which to drop
+                 local content, defaults to None which will drop all components of the dataset
     :param recursive: Whether to recursively step into subdatasets.
     :return: no return value
     """
@@ -144,18 +218,25 @@ def drop_content(dataset: str | os.PathLike, path: str | os.PathLike = None, rec
         raise ValueError("Providing file paths and recursive=True is incompatible.")
 
     dataset: Path = Path(dataset).expanduser().resolve()
-    if path is not None:
-        path: Path = Path(path)
-        if not path.is_absolute():
-            path = dataset / path
-        path = path.expanduser()
+    if path is None:
+        targets = []
+    elif isinstance(path, (str, os.PathLike, Path)):
+        targets = [path]
+    else:
+        targets = list(path)
+
+    for i, p in enumerate(targets):
+        p = Path(p)
+        if not p.is_absolute():
+            p = dataset / p
+        p = p.expanduser()
         # do not resolve symlink of potential annexed file
-        path = path.parent.resolve() / path.name
+        p = p.parent.resolve() / p.name
         # Sanity check: ensure path lies within dataset
         try:
-            path.relative_to(dataset)
+            targets[i] = p.relative_to(dataset).as_posix()
         except ValueError:
-            raise ValueError(f"{path} is not inside root {dataset}")
+            raise ValueError(f"{p} is not inside root {dataset}")
 
     # dl.drop showed connection issues reaching the GIN server -> replace with git annex version
     # dl.drop(dataset=str(dataset), path=path, recursive=recursive, what='filecontent')
@@ -166,17 +247,18 @@ def drop_content(dataset: str | os.PathLike, path: str | os.PathLike = None, rec
             # run annex copy manually, since Datalad implementation proved to be brittle
             _ = _run_git(["annex", "drop", "--all"], cwd=Path(sibling["path"]))
     else:
-        if path is None:
+        if not targets:
             _ = _run_git(["annex", "drop", "--all"], cwd=Path(str(dataset)))
         else:
-            _ = _run_git(["annex", "drop", str(path.name)], cwd=Path(str(dataset)))
+            # one git-annex call for all paths, relative to the dataset root
+            _ = _run_git(["annex", "drop", *targets], cwd=Path(str(dataset)))
 
 
 def find_dataset_root_and_rel(path: str | os.PathLike | Path) -> tuple[Path | None, Path | None]:
     """
     Walk up from `path` until we find a directory containing a dataset.
     Returns (ds_root, relpath_within_dataset) or (None, None) if not found.
-    If `path` is the dataset root, relpath is Path('.').
+    If `path` is the dataset root, relpath is None.
 
     :param path: (Path or str) item path to start walking up from
     """
@@ -191,8 +273,8 @@ def find_dataset_root_and_rel(path: str | os.PathLike | Path) -> tuple[Path | No
             ds = Dataset(p)
             if ds.is_installed():
                 ds_root = p
-                # rel path is relative to ds_root; for the dataset itself, use '.'
-                rel = path.relative_to(ds_root)
+                # rel path is relative to ds_root; None for the dataset itself
+                rel = None if path == ds_root else path.relative_to(ds_root)
                 break
             if p.parent == p:
                 break
@@ -227,10 +309,9 @@ def get_content(dataset: str | os.PathLike, path: str | os.PathLike | list[str |
         p = p.expanduser()
         # do not resolve symlink of potential annexed file
         p = p.parent.resolve() / p.name
-        targets[i] = p
         # Sanity check: ensure path lies within dataset
         try:
-            p.relative_to(dataset)
+            targets[i] = p.relative_to(dataset).as_posix()
         except ValueError:
             raise ValueError(f"{p} is not inside root {dataset}")
 
@@ -244,11 +325,30 @@ def get_content(dataset: str | os.PathLike, path: str | os.PathLike | list[str |
                 # run annex copy manually, since Datalad implementation proved to be brittle
                 _ = _run_git(["annex", "get", "--all"], cwd=Path(sibling["path"]))
     else:
-        for p in targets:
-            # dl.get(dataset=str(dataset), path=str(p) if path else None, recursive=recursive)
-            directory = p if p.is_dir() else p.parent
-            name = '--all' if p.is_dir() else str(p.name)
-            _ = _run_git(["annex", "get", name], cwd=directory)
+        # one git-annex call per batch of paths, relative to the dataset root; directories are fetched recursively
+        for start in range(0, len(targets), _ANNEX_PATH_BATCH):
+            _ = _run_git(["annex", "get", *targets[start:start + _ANNEX_PATH_BATCH]], cwd=dataset)
+
+
+def annex_presence(directory: str | os.PathLike, names: list[str]) -> dict[str, bool] | None:
+    """
+    Looks up which of the given files in a directory are annexed and whether their content is locally present, with
+    two `git annex find` calls per batch of names, which read the annex metadata instead of the files on disk.
+    :param directory: (str, os.PathLike) directory inside an annexed dataset
+    :param names: (list[str]) names of files in directory
+    :return: (dict[str, bool] | None) annexed names mapped to whether their content is present; names that are not
+             annexed are left out. None if git-annex could not be queried.
+    """
+    annexed = set()
+    present = set()
+    for start in range(0, len(names), _ANNEX_PATH_BATCH):
+        batch = names[start:start + _ANNEX_PATH_BATCH]
+        for selection, found in ((["--include=*"], annexed), (["--in=here"], present)):
+            res = _run_git(["annex", "find", *selection, "--format=${file}\\n", "--", *batch], cwd=directory)
+            if res.returncode != 0:
+                return None
+            found.update(res.stdout.splitlines())
+    return {name: name in present for name in annexed}
 
 
 def get_dataset_nodetype(ds_path: str | Path):
@@ -650,15 +750,22 @@ def get_parent_dataset(dataset: str | os.PathLike | Path) -> Path | None:
     return Path(parent.path).expanduser().resolve()
 
 
-def is_gitignored(dataset_path: Path, child_path: Path) -> bool:
+def is_gitignored(dataset_path: Path, child_path: Path, patterns: list[str] | None = None,
+                  is_dir: bool | None = None) -> bool:
     """
     Return True if a direct child of the current dataset matches a simple dataset-local
     .gitignore entry.
     :param dataset_path: path to parent dataset
     :param child_path: path to child item
+    :param patterns: (list[str] | None) patterns from read_gitignore(dataset_path), read if None; pass them when
+                     checking many children
+    :param is_dir: (bool | None) whether child_path is a directory, checked on the filesystem if None
     :return: True if a direct child of the current dataset is listed in .gitignore
     """
-    patterns = read_gitignore(dataset_path)
+    if patterns is None:
+        patterns = read_gitignore(dataset_path)
+    if not patterns:
+        return False
     try:
         rel = child_path.relative_to(dataset_path)
     except ValueError:
@@ -674,8 +781,11 @@ def is_gitignored(dataset_path: Path, child_path: Path) -> bool:
 
         if pattern == rel_str:
             return True
-        if child_path.is_dir() and pattern == rel_dir_str:
-            return True
+        if pattern == rel_dir_str:
+            if is_dir is None:
+                is_dir = child_path.is_dir()
+            if is_dir:
+                return True
 
     return False
 
@@ -696,6 +806,16 @@ def has_content(dataset: str | os.PathLike, path: str | os.PathLike) -> bool:
     path = path.parent.resolve() / path.name
     relative_path = path.relative_to(dataset)
 
+    # a locked annexed file is a symlink into the annex object store, present exactly if the link target exists; this
+    # is decided with a readlink and a stat instead of a git-annex call
+    try:
+        target = os.readlink(path)
+    except OSError:
+        # not a symlink (unlocked or plain git file) or missing
+        target = None
+    if target is not None and _ANNEX_OBJECTS in target.replace(os.sep, '/'):
+        return os.path.exists(path)
+
     return dl.Dataset(str(dataset)).repo.file_has_content(str(relative_path))
 
 
@@ -733,7 +853,7 @@ def pull_from_remotes(dataset: str | os.PathLike,
     Pull latest history from a sibling and merge.
     Optionally walk upward through installed parent datasets and update them as well.
     Returns the post-operation git sync state of the originally requested dataset
-    without performing an extra fetch.
+    without performing an extra fetch. For a recursive pull, only (sub)datasets whose remote changed are updated.
 
     :param dataset: (str) path to the dataset to update from remotes
     :param recursive: whether recursively pull from remotes for the starting dataset, default True
@@ -758,7 +878,10 @@ def pull_from_remotes(dataset: str | os.PathLike,
         if not current_sibling:
             raise RuntimeError("No remote target configured and no 'gin'/'origin' sibling found.")
 
-        ds.update(recursive=current_recursive, how='merge', sibling=current_sibling)
+        if current_recursive:
+            _update_stale_datasets(ds, current_sibling)
+        else:
+            ds.update(recursive=False, how='merge', sibling=current_sibling)
         ds.get(recursive=current_recursive, get_data=False)
 
         if not include_parents:
@@ -772,6 +895,40 @@ def pull_from_remotes(dataset: str | os.PathLike,
 
     return get_git_sync_status(dataset=ds_root, sibling_name=sibling_name, fetch=False)
 
+
+def _update_stale_datasets(ds: Dataset, sibling_name: str) -> None:
+    """
+    Pulls a dataset and all its installed subdatasets from a sibling. Instead of one sequential update per dataset,
+    the remote state of all datasets is queried concurrently first, and only datasets with remote changes are updated.
+    Updates run parent-first, as in a recursive update.
+    :param ds: (Dataset) the top-level dataset
+    :param sibling_name: (str) name of the sibling to pull from
+    :return: no return value
+    """
+    subdatasets = ds.subdatasets(recursive=True, state='present', result_renderer='disabled', return_type='list')
+    # sorted paths list parents before their children
+    paths = sorted([Path(ds.path)] + [Path(sd['path']) for sd in subdatasets])
+
+    with ThreadPoolExecutor(max_workers=min(_LS_REMOTE_WORKERS, len(paths))) as pool:
+        up_to_date = list(pool.map(lambda p: _is_up_to_date_with_remote(p, sibling_name), paths))
+
+    for path, fresh in zip(paths, up_to_date):
+        if not fresh:
+            Dataset(str(path)).update(recursive=False, how='merge', sibling=sibling_name)
+
+
+def _annex_copy_to(dataset: Path, sibling_name: str) -> None:
+    """
+    Copies all annexed content of a dataset to a sibling with git-annex directly, since the DataLad implementation
+    proved to be brittle.
+    :param dataset: (Path) root of the dataset
+    :param sibling_name: (str) name of the sibling
+    :return: no return value
+    """
+    _ = _run_git(["config", f"remote.{sibling_name}.annex-ignore", "false"], cwd=dataset)
+    _ = _run_git(["annex", "copy", "--to", sibling_name, "--all"], cwd=dataset)
+
+
 def push_to_remotes(dataset: str | os.PathLike,
                     recursive: bool = True,
                     message: str | None = None,
@@ -814,18 +971,19 @@ def push_to_remotes(dataset: str | os.PathLike,
         ds = Dataset(str(current))
         current_recursive = recursive if first else False
         sibs = ds.siblings(action="query", return_type="list", recursive=current_recursive)
-        current_sibling = _resolve_sibling_name(dataset=current, sibling_name=sibling_name, recursive=current_recursive)
+        current_sibling = _resolve_sibling_name(dataset=current, sibling_name=sibling_name, recursive=current_recursive,
+                                                sibs=sibs)
         if not current_sibling:
             raise RuntimeError("No publication target configured and no 'gin'/'origin' sibling found.")
 
         ds.push(to=current_sibling, recursive=current_recursive, data="nothing")
         if push_annex_data:
-            for sibling in sibs:
-                if sibling["name"] != current_sibling:
-                    continue
-                _ = _run_git(["config", f"remote.{current_sibling}.annex-ignore", "false"],
-                             cwd=Path(sibling["path"]))
-                _ = _run_git(["annex", "copy", "--to", current_sibling, "--all"], cwd=Path(sibling["path"]))
+            # annexed content is transferred per dataset, independent of the others, so the datasets are copied
+            # concurrently
+            paths = [Path(sibling["path"]) for sibling in sibs if sibling["name"] == current_sibling]
+            if paths:
+                with ThreadPoolExecutor(max_workers=min(_ANNEX_COPY_WORKERS, len(paths))) as pool:
+                    list(pool.map(lambda p: _annex_copy_to(p, current_sibling), paths))
 
         if not include_parents:
             break
@@ -878,7 +1036,8 @@ def remove_siblings(dataset: str | os.PathLike, sibling_name: str | None = 'gin'
     dl.siblings(action='remove', dataset=ds_path, name=sibling_name, recursive=recursive)
 
 
-def save_branch(path: str | Path, recursive: bool = True, message: str = None) -> None:
+def save_branch(path: str | Path, recursive: bool = True, message: str = None,
+                content: list[str | Path] | None = None) -> None:
     """
     Saves an entire datalad branch, walking from the given dataset path up to root. The path given can point to
     content below the dataset.
@@ -886,10 +1045,11 @@ def save_branch(path: str | Path, recursive: bool = True, message: str = None) -
     :param path: (str | Path) path to dataset or content nested within
     :param recursive: (bool) whether to recursively step into the lowest-hierarchy subdatasets
     :param message: (str) optional commit message to add only to the lowest-hierarchy dataset
+    :param content: (list[str | Path] | None) see save_dataset
     :return: No return value
     """
     path = Path(path).expanduser().resolve()
-    ds_root = save_dataset(path=path, recursive=recursive, message=message)
+    ds_root = save_dataset(path=path, recursive=recursive, message=message, content=content)
     if ds_root is None:
         return
     while True:
@@ -906,9 +1066,38 @@ def save_branch(path: str | Path, recursive: bool = True, message: str = None) -
             break
 
 
+def _is_clean(ds_root: Path, pathspec: list[str]) -> bool:
+    """
+    Checks with a single `git status` whether a dataset has nothing to save. git status reports subdatasets with
+    new commits, modified or untracked content as modified, so a clean dataset implies clean subdatasets.
+    :param ds_root: (Path) root of the dataset
+    :param pathspec: (list[str]) limit the check to these paths, the entire dataset if empty
+    :return: (bool) True if clean, False if there are changes or the check failed
+    """
+    args = ["status", "--porcelain=v1", "--untracked-files=normal"]
+    if pathspec:
+        args += ["--", *pathspec]
+    res = _run_git(args, cwd=ds_root)
+    return res.returncode == 0 and not res.stdout.strip()
+
+
+def is_saved(path: str | os.PathLike | Path) -> bool:
+    """
+    Checks whether a file or folder in a dataset has no unsaved changes.
+    :param path: (str or Path) path to the file or folder
+    :return: (bool) True if there is nothing to save for path, False if there is or path is not in a dataset
+    """
+    path = Path(path).resolve().absolute()
+    ds_root, _ = find_dataset_root_and_rel(path)
+    if ds_root is None:
+        return False
+    return _is_clean(ds_root, [str(path)])
+
+
 def save_dataset(path: str | os.PathLike | Path,
                  recursive: bool = True,
-                 message: str = None) -> Path | None:
+                 message: str = None,
+                 content: list[str | Path] | None = None) -> Path | None:
     """
     Saves the current dataset to disk. Path can point to nested item in the dataset. The function will walk up
     the file tree until it finds a dataset.
@@ -916,6 +1105,8 @@ def save_dataset(path: str | os.PathLike | Path,
     :param path: (str or Path) path to the dataset or content in dataset
     :param recursive: (bool) step recursively into subdatasets
     :param message: (str) optional commit message
+    :param content: (list[str | Path] | None) if given, only these paths are saved, in the dataset found for path,
+                    instead of scanning the entire dataset for changes
     :return: (Path) the identified root directory of the dataset
     """
     path = Path(path).resolve().absolute()
@@ -924,7 +1115,14 @@ def save_dataset(path: str | os.PathLike | Path,
     if ds_root is None:
         return None
 
-    if str(rel) == '.':
+    pathspec = [str(p) for p in content] if content is not None else [] if rel is None else [str(path)]
+    if _is_clean(ds_root, pathspec):
+        # nothing to save, spare DataLad's own status walk and the git-annex startup
+        return ds_root
+
+    if content is not None:
+        dl.save(dataset=str(ds_root), path=[str(p) for p in content], recursive=False, message=message)
+    elif rel is None:
         # save dataset
         dl.save(dataset=str(ds_root), recursive=recursive, message=message)
     else:
@@ -987,6 +1185,75 @@ def set_git_annex_path() -> bool:
 
     return False
 
+# [submodule "name"] section header and "key = value" lines of a .gitmodules file
+_GITMODULES_SECTION_RX = re.compile(r'^\s*\[submodule\s+"(.*)"\s*\]\s*$')
+_GITMODULES_KEY_RX = re.compile(r'^\s*([A-Za-z][A-Za-z0-9-]*)\s*=\s*(.*?)\s*$')
+
+
+def _gitconfig_value(value: str) -> str:
+    """
+    Quotes a value for a git config file if it contains characters that git would otherwise interpret.
+    :param value: (str) the raw value
+    :return: (str) the value as written to the file
+    """
+    if value != value.strip() or any(c in value for c in '#;"\\'):
+        return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+    return value
+
+
+def set_submodule_properties(dataset: str | os.PathLike, properties: dict[str, dict[str, str]]) -> bool:
+    """
+    Sets properties (such as url and datalad-url) of several submodules in the .gitmodules file of a dataset with a
+    single read and write, instead of one git call per submodule and property. The change is not saved.
+    :param dataset: (str, os.PathLike) path to the dataset holding the .gitmodules file
+    :param properties: (dict[str, dict[str, str]]) property name -> value per submodule path (relative, posix);
+                       submodules without a .gitmodules entry are ignored
+    :return: (bool) whether .gitmodules was changed
+    """
+    gitmodules = Path(dataset) / ".gitmodules"
+    try:
+        lines = gitmodules.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return False
+
+    changed = False
+    bounds = [i for i, line in enumerate(lines) if line.lstrip().startswith("[")] + [len(lines)]
+    # backwards through the sections, so that inserted lines do not shift the sections still to be processed
+    for start, end in reversed(list(zip(bounds, bounds[1:]))):
+        if not _GITMODULES_SECTION_RX.match(lines[start]):
+            continue
+        keys: dict[str, tuple[int, str]] = {}
+        for i in range(start + 1, end):
+            m = _GITMODULES_KEY_RX.match(lines[i])
+            if m:
+                keys[m.group(1).lower()] = (i, m.group(2))
+        if "path" not in keys:
+            continue
+        props = properties.get(keys["path"][1].strip('"'))
+        if not props:
+            continue
+
+        additions = []
+        for key, value in props.items():
+            entry = f"\t{key} = {_gitconfig_value(value)}"
+            if key.lower() not in keys:
+                additions.append(entry)
+            elif lines[keys[key.lower()][0]].strip() != entry.strip():
+                lines[keys[key.lower()][0]] = entry
+                changed = True
+        if additions:
+            # after the last non-blank line of the section
+            pos = end
+            while pos > start + 1 and not lines[pos - 1].strip():
+                pos -= 1
+            lines[pos:pos] = additions
+            changed = True
+
+    if changed:
+        gitmodules.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return changed
+
+
 def ssh_config_block(host_alias: str, hostname: str, username: str) -> str:
     return (
         f"Host {host_alias}\n"
@@ -1141,12 +1408,14 @@ def ssh_test_connection(host_alias: str) -> tuple[bool, str, str]:
     return False, f"SSH connection to '{host_alias}' failed.", combined
 
 
+# git@host:owner/repo(.git) or git@host:/owner/repo(.git)
+_SSH_URL_RX = re.compile(r"^git@(?P<host>[^:]+):/?(?P<path>.+?)(?:\.git)?$")
+
+
+@functools.lru_cache(maxsize=256)
 def ssh_to_https(u: str) -> str:
     # git@gin.g-node.org:/owner/repo(.git) -> https://gin.g-node.org/owner/repo
-    if u.startswith('git@'):
-        host = u.split('@', 1)[1].split(':', 1)[0]
-        path = u.split(':', 1)[1]
-        if path.endswith('.git'):
-            path = path[:-4]
-        return f"https://{host}{path}"
-    return u
+    m = _SSH_URL_RX.match(u)
+    if m is None:
+        return u
+    return f"https://{m['host']}/{m['path']}"
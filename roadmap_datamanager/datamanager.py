@@ -1,9 +1,13 @@
 # datamanager.py
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import os
+import re
 import shutil
+import stat
 
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -17,17 +21,84 @@ from roadmap_datamanager import metadata as md
 from roadmap_datamanager import datalad_gin_api as dgapi
 from roadmap_datamanager import datalad_utils
 
-#  Install policy
-ALLOWED_CATEGORIES = [
+#  Install policy: categories in display order, and as a set for membership tests
+ALLOWED_CATEGORIES_ORDER = (
     "autocontrol", "raw", "reduced", "measurement", "analysis",
     "template", "experimental_optimization", "model",
-]
+)
+ALLOWED_CATEGORIES = frozenset(ALLOWED_CATEGORIES_ORDER)
+
+# section header of a git remote in .git/config, e.g. [remote "gin"]
+_GIT_REMOTE_RX = re.compile(r'^\s*\[remote\s+"([^"]+)"\s*\]', re.MULTILINE)
+
+# Max. number of items of an install_many batch copied concurrently
+_INSTALL_WORKERS = 4
 
 #
 GITIGNORE = """
 autocontrol/
 """
 
+def _resolve(path: str | os.PathLike) -> Path:
+    """
+    Expands and resolves path like Path(path).expanduser().resolve(). Not cached: the result depends on symlinks in
+    the file system, which may change during a session (e.g. a relinked or remounted data directory).
+    :param path: (str | PathLike) the path
+    :return: (Path) the resolved path
+    """
+    return Path(path).expanduser().resolve()
+
+
+def _copy_file(src: str, dst: str) -> str:
+    """
+    Copies a file with its metadata, like shutil.copy2. Where available (Linux), the data is copied with
+    os.copy_file_range, which lets copy-on-write file systems (btrfs, XFS) share the blocks instead of duplicating
+    them and otherwise copies within the kernel. Falls back to shutil.copy2 if copy_file_range is not supported.
+    :param src: (str) source file
+    :param dst: (str) destination file or directory
+    :return: (str) the destination file
+    """
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(src, dst)
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    # some file systems (procfs, sysfs, several FUSE/overlay setups) report an unsupported copy by
+                    # copying nothing instead of raising; treated like the errors below, not as a finished copy
+                    break
+                remaining -= copied
+    except OSError:
+        # e.g. EXDEV across file systems on older kernels, or EOPNOTSUPP
+        return shutil.copy2(src, dst)
+    if remaining > 0:
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+@dataclass(slots=True)
+class InstallSpec:
+    """
+    A file or folder to install with DataManager.install_many. The fields are the arguments of
+    DataManager.install_into_tree.
+    """
+    source: os.PathLike | str
+    project: Optional[str]
+    campaign: Optional[str]
+    experiment: str
+    category: str
+    dest_rel: Optional[os.PathLike | str] = None
+    rename: Optional[str] = None
+    move: bool = False
+    metadata: Optional[Dict[str, Any]] = None
+    overwrite: bool = False
+
+
 class DataManager:
     """
     ROADMAP Data Manager class.
@@ -99,10 +170,20 @@ class DataManager:
             env=env or {},
             GIN_url=eff_GIN_url,
             GIN_repo=eff_GIN_repo,
-            GIN_user=eff_GIN_user
+            GIN_user=eff_GIN_user,
+            # GUI settings, only kept from the persisted configuration
+            use_qt_file_system_model=persisted.use_qt_file_system_model,
+            use_native_file_dialog=persisted.use_native_file_dialog,
         )
+        # the configuration as last saved by this instance, see save_current_dm_configuration
+        self._saved_cfg: dict[str, Any] | None = None
         self.save_current_dm_configuration()
 
+        # path -> Dataset, see _dataset
+        self._ds_cache: dict[str, Dataset] = {}
+        # path -> (size and mtime of .git/config, sibling records), see _siblings
+        self._siblings_cache: dict[str, tuple[tuple[int, int], list[dict]]] = {}
+
         if self.cfg.verbose:
             print(f"[DataManager] root={root_path}")
             print(f"[DataManager] user={self.cfg.user_name} <{self.cfg.user_email}>")
@@ -131,6 +212,55 @@ class DataManager:
             GIN_user=persisted.GIN_user
         )
 
+    def _dataset(self, path: str | os.PathLike) -> Dataset:
+        """
+        Returns the (cached) Dataset object for path.
+        :param path: (str | PathLike) path to the dataset
+        :return: (Dataset) the dataset object
+        """
+        key = str(path)
+        ds = self._ds_cache.get(key)
+        if ds is None:
+            ds = self._ds_cache[key] = Dataset(key)
+        return ds
+
+    def _siblings(self, path: str | os.PathLike) -> list[dict]:
+        """
+        Queries the siblings of the dataset at path (non-recursive). The result is cached until the .git/config of the
+        dataset, which holds the remotes, changes.
+        :param path: (str | PathLike) path to an installed dataset
+        :return: (list[dict]) the sibling records
+        """
+        key = str(path)
+        try:
+            st = os.stat(os.path.join(key, ".git", "config"))
+            stamp = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            # e.g. .git is a file pointing to the repository elsewhere: no caching
+            stamp = None
+        cached = self._siblings_cache.get(key)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return cached[1]
+        sibs = self._dataset(key).siblings(action="query", return_type="list")
+        if stamp is not None:
+            self._siblings_cache[key] = (stamp, sibs)
+        return sibs
+
+    @staticmethod
+    def _remote_names(path: str | os.PathLike) -> set[str] | None:
+        """
+        Reads the names of the git remotes of the dataset at path directly from its .git/config, without a git
+        subprocess.
+        :param path: (str | PathLike) path to an installed dataset
+        :return: (set[str] | None) the remote names, or None if the config could not be read
+        """
+        try:
+            with open(os.path.join(path, ".git", "config"), encoding="utf-8") as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+        return set(_GIT_REMOTE_RX.findall(text))
+
     def _ensure_dataset(self,
                         path: Path,
                         name,
@@ -138,7 +268,8 @@ class DataManager:
                         dataset_type: str = 'below-experiment',
                         register_installed: bool = False,
                         force: bool = False,
-                        do_not_save:bool = False) -> None:
+                        do_not_save:bool = False,
+                        update_superds: bool = True) -> bool:
         """
         If dataset at `path` exists, (optionally) ensure it's registered in `superds`.
         Otherwise, create_dataset it (registered when superds is given).
@@ -148,20 +279,21 @@ class DataManager:
         :param superds: Path pointing to the parent dataset.
         :param register_installed: (bool) Whether to register the dataset with its parent if already installed.
         :param do_not_save: (bool) Whether not to save_dataset the dataset.
-        :return: None
+        :param update_superds: (bool) Whether to merge remote changes into superds before creating the dataset. Not
+                               needed if superds was just created.
+        :return: (bool) True if the dataset was created, False if it already existed
         """
-        path = Path(path).resolve()
-        ds = Dataset(str(path))
+        path = _resolve(path)
+        ds = self._dataset(path)
 
         if ds.is_installed():
             if superds is not None and register_installed:
                 # If already registered, this is a no-op (status=notneeded)
-                dl.save(
-                    dataset=str(superds),
+                self._dataset(superds).save(
                     path=[str(path)],
                     message=f"Register existing subdataset {path} with parent dataset {str(superds)}."
                 )
-            return
+            return False
 
         # Create (and register if superds is provided)
         if superds is None:
@@ -171,25 +303,26 @@ class DataManager:
         else:
             # create_dataset and register as subdataset of superds in one API call
             # merge any remote changes into superdataset before committing local changes
-            dl.update(dataset=superds, recursive=False, how='merge')
-            dl.create(path=str(path), dataset=str(superds), cfg_proc="text2git", force=force)
-            # saving will be done in save_meta()
-            # dgapi.save_branch(path=superds, recursive=False)
+            if update_superds:
+                self._dataset(superds).update(recursive=False, how='merge')
+            self._dataset(superds).create(path=str(path), cfg_proc="text2git", force=force)
+            # the registration with superds is not saved here, but together with the metadata of the new dataset by
+            # save_meta(), or by the caller in one batch when do_not_save is set (see init_tree)
 
         if dataset_type == 'experiment' and not (path / ".gitignore").is_file():
             (path / ".gitignore").write_text(GITIGNORE.strip() + "\n", encoding="utf-8")
 
-        # dataset save_dataset here is not necessary, as it is saved in save_meta
-        # dl.save_dataset(dataset=str(path), recursive=recursive_save, message=f"Initialized dataset.")
+        # a separate save is not necessary, the dataset is saved in save_meta or deferred to the caller
         self.save_meta(path, name=name, dataset_type=dataset_type, do_not_save=do_not_save)
-
+        return True
 
     def clone_from_remote(self,
                           dest: str | os.PathLike,
                           source_url: str = None,
                           source_url_root: str = None,
                           user: str = None,
-                          repo_name: str = None):
+                          repo_name: str = None,
+                          lean: bool = False):
         """
         Clone a superdataset from GIN into dest, install subdatasets (no data),
         normalize all GIN remotes to the sibling name 'gin', and remove 'origin'.
@@ -202,6 +335,7 @@ class DataManager:
         :param source_url_root: (str) URL root of the GIN dataset to clone, defaults to None
         :param user: (str) GIN unser name for the repository, defaults to None
         :param repo_name: (str) repo name of the repository, defaults to None
+        :param lean: (bool) shallow, single-branch clone of the superdataset, defaults to False
         :return: the path to the cloned GIN dataset
         """
 
@@ -215,7 +349,8 @@ class DataManager:
                 if repo_name is None:
                     raise RuntimeError(f"No repository name provided.")
 
-        dgapi.clone_from_remote(dest=dest, source_url=source_url, source_url_root=source_url_root, user_name=user, repo_name=repo_name)
+        dgapi.clone_from_remote(dest=dest, source_url=source_url, source_url_root=source_url_root, user_name=user,
+                                repo_name=repo_name, lean=lean)
 
         return
 
@@ -233,8 +368,8 @@ class DataManager:
         level = "root"
         ds_path = None
 
-        root = Path(self.cfg.dm_root).expanduser().resolve()
-        cur = Path(path).expanduser().resolve()
+        root = _resolve(self.cfg.dm_root)
+        cur = _resolve(path)
 
         try:
             rel = cur.relative_to(root)
@@ -291,20 +426,44 @@ class DataManager:
         cp = pp / campaign if (pp and campaign) else None
         ep = cp / experiment if (cp and experiment) else None
 
-        # Ensure/create_dataset datasets
-        self._ensure_dataset(up, superds=None, name=self.cfg.user_name, dataset_type='root', force=force,
-                             do_not_save=force)
-
+        # Ensure/create_dataset datasets. Saving is deferred until the entire tree exists.
+        levels = [(up, None, self.cfg.user_name, 'root')]
         if pp:
-            self._ensure_dataset(pp, superds=up, name=project, dataset_type='project', force=force, do_not_save=force)
+            levels.append((pp, up, project, 'project'))
         if cp:
-            self._ensure_dataset(cp, superds=pp, name=campaign, dataset_type='campaign', force=force, do_not_save=force)
+            levels.append((cp, pp, campaign, 'campaign'))
         if ep:
-            self._ensure_dataset(ep, superds=cp, name=experiment, dataset_type='experiment', force=force,
-                                 do_not_save=force)
+            levels.append((ep, cp, experiment, 'experiment'))
+
+        # Usually the tree already exists down to some level. Look for the deepest installed dataset first, walking
+        # upward, as the ancestors of an installed dataset are installed, too, and need no checks of their own.
+        start = 0
+        for i in range(len(levels) - 1, -1, -1):
+            if self._dataset(levels[i][0]).is_installed():
+                start = i + 1
+                break
+
+        # merge remote changes once, into the deepest existing dataset, before creating datasets below it; datasets
+        # created here have nothing to merge, and neither has a dataset without remotes
+        if 0 < start < len(levels):
+            parent = levels[start - 1][0]
+            if self._remote_names(parent) != set():
+                self._dataset(parent).update(recursive=False, how='merge')
+
+        created = []
+        for path, superds, name, dataset_type in levels[start:]:
+            if self._ensure_dataset(path, superds=superds, name=name, dataset_type=dataset_type, force=force,
+                                    do_not_save=True, update_superds=False):
+                created.append(path)
 
         if force:
             dgapi.save_dataset(path=up, recursive=True)
+        elif created:
+            # one save per new dataset, deepest first, so that each new parent commits its metadata together with the
+            # new child; save_branch then registers the topmost new dataset with the already existing parents
+            for path in reversed(created[1:]):
+                dgapi.save_dataset(path=path, recursive=False, message="Initialized dataset.")
+            dgapi.save_branch(path=created[0], recursive=False, message="Initialized dataset.")
 
         if self.cfg.verbose:
             print(f"Initialized/verified tree at {up} for "
@@ -345,59 +504,178 @@ class DataManager:
         :return: path to destination of file or dataset
         """
 
-        src = Path(source).expanduser().resolve()
         # Don't enforce categories for now. Maybe remove entirely later
         # if category not in ALLOWED_CATEGORIES:
-        #    raise ValueError(f"category must be one of {ALLOWED_CATEGORIES}, got {category!r}")
-        if not src.exists():
-            raise FileNotFoundError(src)
-
-        # make sure the nested dataset structure exists for project/campaign/experiment
-        ep = self.init_tree(project=project, campaign=campaign, experiment=experiment)
-
-        # make sure that the category subfolder exists
-        cat_path = ep / category
-        if not cat_path.exists():
-            cat_path.mkdir(parents=True)
+        #    raise ValueError(f"category must be one of {ALLOWED_CATEGORIES_ORDER}, got {category!r}")
+        return self.install_many([InstallSpec(
+            source=source, project=project, campaign=campaign, experiment=experiment, category=category,
+            dest_rel=dest_rel, rename=rename, move=move, metadata=metadata, overwrite=overwrite
+        )])[0]
+
+    def install_many(self, items: list[InstallSpec],
+                     failed: Optional[list[tuple[InstallSpec, BaseException]]] = None) -> list[Path | None]:
+        """
+        Installs several files or folders, see install_into_tree for the rules. The dataset tree is ensured and the
+        experiment dataset saved once per experiment, instead of once per item. Up to _INSTALL_WORKERS items of an
+        experiment are copied concurrently.
+        :param items: (list[InstallSpec]) the files or folders to install
+        :param failed: (list | None) if given, an item that cannot be installed is appended as (item, exception);
+                       otherwise the first failure of an experiment is raised once its other items are installed
+        :return: paths to the destinations of the items, in the order of items; None for failed items
+        """
+        def _fail(spec: InstallSpec, exc: BaseException):
+            if failed is None:
+                raise exc
+            failed.append((spec, exc))
+
+        # a single stat per source for the existence and file/folder checks; all sources are checked before anything
+        # is installed
+        sources: list[tuple[Path, int] | None] = []
+        for spec in items:
+            src = Path(spec.source).expanduser().resolve()
+            try:
+                src_mode = os.stat(src).st_mode
+            except FileNotFoundError:
+                src_mode = None
+            sources.append((src, src_mode) if src_mode is not None else None)
+            if src_mode is None:
+                # raised outside the except clause, without the context of the stat error
+                _fail(spec, FileNotFoundError(src))
+
+        by_experiment: dict[tuple[Optional[str], Optional[str], str], list[int]] = {}
+        for i, spec in enumerate(items):
+            if sources[i] is not None:
+                by_experiment.setdefault((spec.project, spec.campaign, spec.experiment), []).append(i)
+
+        targets: list[Path | None] = [None] * len(items)
+        for (project, campaign, experiment), indices in by_experiment.items():
+            # make sure the nested dataset structure exists for project/campaign/experiment
+            try:
+                ep = self.init_tree(project=project, campaign=campaign, experiment=experiment)
+            except Exception as exc:
+                for i in indices:
+                    _fail(items[i], exc)
+                continue
+            # the items are copied concurrently, as copying is mostly waiting for I/O; their metadata is then recorded
+            # one after the other, as all of it goes into the same metadata.json
+            errors: list[tuple[int, BaseException]] = []
+            placed = {}
+            claimed = set()
+            with ThreadPoolExecutor(max_workers=min(_INSTALL_WORKERS, len(indices))) as pool:
+                for i in indices:
+                    src, src_mode = sources[i]
+                    target = self._install_target(items[i], src, ep)
+                    if target in claimed:
+                        # another item of this batch goes to the same destination
+                        errors.append((i, FileExistsError(target)))
+                        continue
+                    claimed.add(target)
+                    placed[i] = pool.submit(self._place_item, items[i], src, src_mode, target)
+
+            # only the installed items and metadata.json change, save just these instead of scanning the entire
+            # experiment dataset
+            content = [ep / 'metadata.json']
+            installed = []
+            ignored_categories = {}
+            try:
+                for i, future in placed.items():
+                    try:
+                        target = future.result()
+                        self.save_meta(ep, path=target.relative_to(ep), extra=items[i].metadata, do_not_save=True)
+                    except Exception as exc:
+                        errors.append((i, exc))
+                        continue
+                    targets[i] = target
+                    installed.append(target.relative_to(ep))
+                    # content of an ignored category is not saved
+                    category = items[i].category
+                    if category not in ignored_categories:
+                        ignored_categories[category] = dgapi.is_gitignored(ep, ep / category, is_dir=True)
+                    if not ignored_categories[category]:
+                        content.append(target)
+            finally:
+                # also save the installed items if others failed
+                if installed:
+                    message = f"Metadata for {installed[0]}" if len(installed) == 1 else \
+                        f"Metadata for {len(installed)} items"
+                    dgapi.save_branch(path=ep, recursive=False, message=message, content=content)
+            errors.sort(key=lambda error: error[0])
+            for i, exc in errors:
+                _fail(items[i], exc)
+        return targets
 
-        # make sure any relative path from category exists, if given
-        if dest_rel:
-            dest_path = cat_path / dest_rel
-        else:
-            dest_path = cat_path
+    @staticmethod
+    def _install_target(spec: InstallSpec, src: Path, ep: Path) -> Path:
+        """
+        Destination of an item in an experiment dataset.
+        :param spec: (InstallSpec) the item to install
+        :param src: (Path) resolved source path
+        :param ep: (Path) the experiment dataset
+        :return: (Path) the path the item is copied or moved to
+        """
+        # destination folder: the category subfolder, or a relative path below it, if given
+        dest_path = ep / spec.category
+        if spec.dest_rel:
+            dest_path = dest_path / spec.dest_rel
+        return dest_path / (spec.rename or src.name)
 
-        # after computing the destination folder dest_path, create_dataset it if not already exists
-        dest_path.mkdir(parents=True, exist_ok=True)
-        # decide the final target path for file/dir
-        final_target = (dest_path / (rename or src.name))
+    def _place_item(self, spec: InstallSpec, src: Path, src_mode: int, final_target: Path) -> Path:
+        """
+        Copies or moves a single file or folder to its destination in an experiment dataset. Safe to run concurrently
+        for different destinations.
+        :param spec: (InstallSpec) the item to install
+        :param src: (Path) resolved source path
+        :param src_mode: (int) st_mode of the source
+        :param final_target: (Path) destination, see _install_target
+        :return: (Path) final_target
+        """
+        # create the destination folder including the category subfolder in one call, if not already existing
+        os.makedirs(final_target.parent, exist_ok=True)
 
-        if final_target.exists():
-            if not overwrite:
+        # lexists: an annexed file without local content is a dangling symlink, but still occupies the target
+        if os.path.lexists(final_target):
+            if not spec.overwrite:
                 raise FileExistsError(final_target)
 
-        # copy file or folder to destination, register metadata, save_dataset dataset
-        if src.is_file():
+        # copy file or folder to destination
+        if spec.move and self._rename(src, final_target):
+            # moved within the file system, nothing left to copy
+            pass
+        elif stat.S_ISREG(src_mode):
             # for files, move and copy2 will replace existing files of the same name by default
-            if move:
+            if spec.move:
                 shutil.move(str(src), str(final_target))
             else:
-                shutil.copy2(str(src), str(final_target))
-        elif src.is_dir():
-            shutil.copytree(str(src), str(final_target), dirs_exist_ok=overwrite)
-            if move:
+                _copy_file(str(src), str(final_target))
+        elif stat.S_ISDIR(src_mode):
+            shutil.copytree(str(src), str(final_target), copy_function=_copy_file, dirs_exist_ok=spec.overwrite)
+            if spec.move:
                 # the move command does not have a dirs_exist_ok option and would potentially
                 # place a source dir into an existing dest dir of the same name instead of
                 # replacing
-                src.rmdir()
+                shutil.rmtree(src)
         else:
             raise FileNotFoundError(src)
-
-        self.save_meta(ep, path=final_target.relative_to(ep), extra=metadata)
-        # not necessary, as save_meta alreaddy saved the experiment, recursive=True below should also
-        # be redundant
-        # self.save_dataset(dataset=str(ep), recursive=True, message=f"Installed {rename or src.name}")
         return final_target
 
+    @staticmethod
+    def _rename(src: Path, dst: Path) -> bool:
+        """
+        Moves src to dst with a single rename if both are on the same file system, which only changes directory
+        entries, independent of the size of src. An existing file dst is replaced, a non-empty directory is not.
+        :param src: (Path) the file or folder to move
+        :param dst: (Path) the target path, whose parent directory exists
+        :return: (bool) True if src was renamed, False if it has to be copied and deleted instead
+        """
+        try:
+            if os.stat(src).st_dev != os.stat(dst.parent).st_dev:
+                return False
+            os.replace(src, dst)
+        except OSError:
+            # e.g. EXDEV, or dst is a non-empty directory
+            return False
+        return True
+
     @staticmethod
     def load_meta(ds_path: str | Path, *, path: str | Path | None = None, mode: str = 'meta') -> Dict[str, Any]:
         """
@@ -428,27 +706,29 @@ class DataManager:
         else fall back to `self.cfg.dm_root`. From there, run a single recursive publish/push.
         """
         # normalize inputs
-        start_path = Path(dataset or self.cfg.dm_root).expanduser().resolve()
-        root_path = Path(self.cfg.dm_root).resolve()
+        start_path = _resolve(dataset or self.cfg.dm_root)
+        root_path = _resolve(self.cfg.dm_root)
 
         if repo_name is None:
             repo_name = self.cfg.user_name
 
-        if not Dataset(str(start_path)).is_installed():
+        if not self._dataset(start_path).is_installed():
             raise RuntimeError(f"Not a DataLad dataset: {start_path}")
 
         # climb until you find an ancestor with the target sibling, or root
         ds_path = start_path
         while True:
-            ds = Dataset(str(ds_path))
+            ds = self._dataset(ds_path)
             if not ds.is_installed():
                 raise RuntimeError(f"Ancestor not installed as dataset: {ds_path}")
 
             # Has the target sibling already? Note: cloned trees often have a sibling name 'origin' independent of
             # the initial designation.
-            sibs = ds.siblings(action="query", return_type="list")
-            has_target_sibling_name = any(s.get("name") == sibling_name for s in sibs)
-            has_target_origin = any(s.get("name") == 'origin' for s in sibs)
+            names = self._remote_names(ds_path)
+            if names is None:
+                names = {s.get("name") for s in self._siblings(ds_path)}
+            has_target_sibling_name = sibling_name in names
+            has_target_origin = 'origin' in names
 
             if has_target_sibling_name:
                 sibling_name_arg = sibling_name
@@ -465,7 +745,8 @@ class DataManager:
                 break
 
             # guard: if we’re no longer moving up, bail (dataset not under self.cfg.dm_root)
-            parent = ds_path.parent.resolve()
+            # ds_path is resolved, and so is its parent
+            parent = ds_path.parent
             if parent == ds_path:
                 raise RuntimeError(
                     f"{start_path} is not within managed root {root_path}; refusing to climb past filesystem root."
@@ -485,7 +766,7 @@ class DataManager:
         )
 
         # Save narrowly (only where needed) before the push, but OK to be simple here
-        Dataset(str(chosen)).save(recursive=True, message=message or "Publish subtree")
+        self._dataset(chosen).save(recursive=True, message=message or "Publish subtree")
 
         # This should be unnecessary, as pushing is done by publish_gin_sibling()
         """
@@ -530,7 +811,7 @@ class DataManager:
         # init reference dataset
         if dataset is None:
             dataset = str(self.cfg.dm_root)
-        ds = Dataset(str(dataset))
+        ds = self._dataset(dataset)
 
         # compute repo name
         root_path, relpath, ds_path, relposix = datalad_utils.ensure_paths(ds_path=self.cfg.dm_root, path=dataset)
@@ -539,7 +820,7 @@ class DataManager:
         if str(relposix) != '.':
             repo_name = repo_name + '-' + '-'.join(relpath.parts)
             ds_parent_path = ds_path.parent
-            ds_parent = Dataset(ds_parent_path)
+            ds_parent = self._dataset(ds_parent_path)
         else:
             ds_parent = None
             ds_parent_path = None
@@ -572,7 +853,8 @@ class DataManager:
             published_ds_paths.add(Path(entry_ds_path).resolve())
 
         # register GIN URLs in .gitmodules of the parents as the above command placed them only in the
-        # .git/ record of the sibling itself
+        # .git/ record of the sibling itself; collected per parent to rewrite each .gitmodules once
+        gitmodules_updates: dict[Path, dict[str, dict[str, str]]] = {}
         for entry in siblist:
             # siblist contains entries for all actions performed during sibling creation. Since we only need the path,
             # take it from the 'configure-sibling' action
@@ -593,14 +875,14 @@ class DataManager:
             else:
                 https_url = dgapi.ssh_to_https(url)
 
-            dl.subdatasets(
-                dataset=str(parent),
-                path=str(ds_path),
-                set_property=[
-                    ('url', https_url),
-                    ('datalad-url', url)
-                ]
-            )
+            gitmodules_updates.setdefault(parent, {})[ds_path.relative_to(parent).as_posix()] = {
+                'url': https_url,
+                'datalad-url': url,
+            }
+
+        # the changes are saved by push_to_remotes below, the parent of the published dataset by the second call
+        for parent, properties in gitmodules_updates.items():
+            dgapi.set_submodule_properties(parent, properties)
 
         # save_dataset and push to remotes
         dgapi.push_to_remotes(dataset=str(dataset), recursive=recursive, message='GIN publishing',
@@ -618,10 +900,15 @@ class DataManager:
 
     def save_current_dm_configuration(self):
         """
-        Save the current data manager configuration to disk.
+        Save the current data manager configuration to disk, unless it is unchanged since this instance last saved it.
         :return: no return value
         """
+        # asdict copies nested values (e.g. env), so that later in-place changes are detected as well
+        state = asdict(self.cfg)
+        if state == self._saved_cfg:
+            return
         dmc.save_persistent_cfg(self.cfg)
+        self._saved_cfg = state
 
     def save_meta(self,
                   ds_path: str | Path, *,
@@ -629,7 +916,7 @@ class DataManager:
                   name: Optional[str] = None,
                   dataset_type: str = 'below-experiment',
                   extra: Optional[Dict[str, Any]] = None,
-                  do_not_save = False) -> None:
+                  do_not_save = False) -> Dict[str, Any]:
         """
         Attach JSON-LD at dataset level to any file, folder, or the dataset itself using the MetaLad Python API.
         :param ds_path: (str, Path) path to the dataset
@@ -641,11 +928,11 @@ class DataManager:
                                    folders that belong to an experiment dataset
         :param extra: (Dict[str, Any]) optional extra metadata to be attached beyond default fields
         :param do_not_save: (bool) whether to save_dataset recursively or not
-        :return: None
+        :return: (Dict[str, Any]) the saved metadata, as load_meta returns it
         """
 
         meta = md.Metadata(ds_root=ds_path, path=path)
-        meta.add(
+        changed = meta.add(
             payload=extra,
             mode='overwrite',
             name=name,
@@ -655,11 +942,14 @@ class DataManager:
             extractor_name=self.cfg.extractor_name,
             extractor_version=self.cfg.extractor_version,
         )
-        meta.save()
         targetstr = str(path) if path is not None else str(ds_path)
+        if changed:
+            meta.save()
+        elif self.cfg.verbose:
+            print(f"Metadata unchanged for {targetstr}")
 
-        # Commit metadata
-        if not do_not_save:
+        # Commit metadata; unchanged metadata is only committed if an earlier change was not saved yet
+        if not do_not_save and (changed or not dgapi.is_saved(meta.metapath)):
             dgapi.save_branch(
                 path=str(ds_path),
                 message=f"Metadata for {targetstr}",
@@ -669,20 +959,35 @@ class DataManager:
             print(f"Added metadata to dataset {targetstr}")
             print(f"Payload:")
             print(extra)
+        return meta.get(mode='meta')
 
-    @staticmethod
-    def remove_from_tree(dataset: str | os.PathLike, path: str | os.PathLike = None, recursive: bool = False,
-                         reckless: str = None) -> None:
+    def remove_from_tree(self, dataset: str | os.PathLike, path: str | os.PathLike | list[str | os.PathLike] = None,
+                         recursive: bool = False, reckless: str = None) -> None:
         """
         Remove content from filesystem after confirming availability elsewhere.
         :param dataset: (str, os.Pathlike) path to the dataset for which to drop local content
-        :param path: (str, os.Pathlike) relative path to the dataset component for which to drop local content,
-                      defaults to None which will drop all components of the dataset
+        :param path: (str, os.Pathlike, list) relative path(s) to the dataset component(s) for which to drop local
+                      content, defaults to None which will drop all components of the dataset
         :param recursive: whether to recursively step into subdatasets
         :param reckless: disable safety measures for removing local content (see datalad api for remove), default None
         :return: no return value
         """
-        if path is not None:
-            path = str(path)
-        content_path = Path(dataset) / Path(path)
-        dl.remove(dataset=str(dataset), path=content_path, recursive=recursive, reckless=reckless)
+        if path is None:
+            content_path = None
+        elif isinstance(path, (str, os.PathLike)):
+            content_path = Path(dataset) / Path(path)
+        else:
+            # datalad removes a list of paths in one call
+            content_path = [str(Path(dataset) / Path(p)) for p in path]
+        self._dataset(dataset).remove(path=content_path, recursive=recursive, reckless=reckless)
+        # removed (sub)datasets must not be served from the cache anymore
+        if content_path is None:
+            removed = [str(dataset)]
+        elif isinstance(content_path, list):
+            removed = content_path
+        else:
+            removed = [str(content_path)]
+        prefixes = tuple(r + os.sep for r in removed)
+        for key in list(self._ds_cache):
+            if key in removed or key.startswith(prefixes):
+                del self._ds_cache[key]
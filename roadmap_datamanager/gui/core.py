@@ -1,51 +1,493 @@
 from __future__ import annotations
 
+from array import array
+import collections
+import importlib.util
 import logging
+import os
+import queue
 import sys
+import threading
+from types import ModuleType
 
-from PySide6.QtCore import Qt, QObject, Signal, Slot, QRunnable
-from PySide6.QtGui import QPalette, QColor
-from PySide6.QtWidgets import QDialog, QDialogButtonBox, QFormLayout, QLineEdit
+from PySide6.QtCore import (
+    Qt, QAbstractItemModel, QAbstractListModel, QCoreApplication, QEvent, QModelIndex, QObject, Signal, Slot,
+    QRunnable, QThreadPool, QTimer
+)
+from PySide6.QtGui import QColor, QFont, QIcon, QPalette
+from PySide6.QtWidgets import QDialog, QFileIconProvider, QFormLayout, QHBoxLayout, QLineEdit, QPushButton
 
+_Role = QPalette.ColorRole
+_Grp = QPalette.ColorGroup
+_GC = Qt.GlobalColor
 
-def create_light_palette():
+_C230 = QColor(230, 230, 230)
+_C240 = QColor(240, 240, 240)
+_C255 = QColor(255, 255, 255)
+_LINK_BLUE = QColor(42, 130, 218)
+
+# built on first use: QPalette() starts from the application palette, which only exists once QApplication is set up
+_LIGHT_PALETTE: QPalette | None = None
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Registers a module that is only executed on its first attribute access, using importlib's LazyLoader. Later imports
+    of the module anywhere return the same, still unloaded, module. The first access is not thread-safe; touch the
+    module on the GUI thread with ensure_loaded before workers can use it.
+    :param name: (str) absolute module name
+    :return: (ModuleType) the module
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent, _, child = name.rpartition('.')
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def ensure_loaded(*modules: ModuleType):
+    """
+    Executes modules registered by lazy_import, if not done yet.
+    :param modules: (ModuleType) the modules
+    :return: no return value
+    """
+    for module in modules:
+        # any attribute access loads a lazy module
+        getattr(module, '__dict__')
+
+
+def _build_light_palette():
     p = QPalette()
-    p.setColor(QPalette.ColorRole.Window, QColor(240, 240, 240))
-    p.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.black)
-    p.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
-    p.setColor(QPalette.ColorRole.AlternateBase, QColor(240, 240, 240))
-    p.setColor(QPalette.ColorRole.ToolTipBase, Qt.GlobalColor.white)
-    p.setColor(QPalette.ColorRole.ToolTipText, Qt.GlobalColor.black)
-    p.setColor(QPalette.ColorRole.Text, Qt.GlobalColor.black)
-    p.setColor(QPalette.ColorRole.Button, QColor(240, 240, 240))
-    p.setColor(QPalette.ColorRole.ButtonText, Qt.GlobalColor.black)
-    p.setColor(QPalette.ColorRole.BrightText, Qt.GlobalColor.red)
-    p.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-    p.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-    p.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.white)
+    p.setColor(_Role.Window, _C240)
+    p.setColor(_Role.WindowText, _GC.black)
+    p.setColor(_Role.Base, _C255)
+    p.setColor(_Role.AlternateBase, _C240)
+    p.setColor(_Role.ToolTipBase, _GC.white)
+    p.setColor(_Role.ToolTipText, _GC.black)
+    p.setColor(_Role.Text, _GC.black)
+    p.setColor(_Role.Button, _C240)
+    p.setColor(_Role.ButtonText, _GC.black)
+    p.setColor(_Role.BrightText, _GC.red)
+    p.setColor(_Role.Link, _LINK_BLUE)
+    p.setColor(_Role.Highlight, _LINK_BLUE)
+    p.setColor(_Role.HighlightedText, _GC.white)
 
     # --- inactive buttons ---
-    p.setColor(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Button, QColor(230, 230, 230))
-    p.setColor(QPalette.ColorGroup.Inactive, QPalette.ColorRole.ButtonText, QColor(80, 80, 80))
+    p.setColor(_Grp.Inactive, _Role.Button, _C230)
+    p.setColor(_Grp.Inactive, _Role.ButtonText, QColor(80, 80, 80))
 
     # --- disabled buttons ---
-    p.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Button, QColor(230, 230, 230))
-    p.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, QColor(150, 150, 150))
+    p.setColor(_Grp.Disabled, _Role.Button, _C230)
+    p.setColor(_Grp.Disabled, _Role.ButtonText, QColor(150, 150, 150))
     return p
 
 
-class EmittingStream(QObject):
+def create_light_palette():
+    global _LIGHT_PALETTE
+    if _LIGHT_PALETTE is None:
+        _LIGHT_PALETTE = _build_light_palette()
+    return QPalette(_LIGHT_PALETTE)
+
+
+class DMRows:
+    """
+    Rows of a DMListModel, held as parallel columns (structure of arrays) instead of an object or tuple per row. Each
+    row has a name, path str, posix path relative to the dataset, an index into the style table of the model, and
+    whether it is a directory.
+    """
+    __slots__ = ('names', 'paths', 'rel_paths', 'styles', 'dirs')
+
+    def __init__(self):
+        self.names: list[str] = []
+        self.paths: list[str] = []
+        self.rel_paths: list[str] = []
+        self.styles = array('B')
+        self.dirs = array('B')
+
+    def __len__(self):
+        return len(self.names)
+
+    def append(self, name: str, path_str: str, rel_path: str, style: int, is_dir: bool):
+        self.names.append(name)
+        self.paths.append(path_str)
+        self.rel_paths.append(rel_path)
+        self.styles.append(style)
+        self.dirs.append(is_dir)
+
+
+class DMListModel(QAbstractListModel):
+    """
+    Flat list model of the datamanager panel. The rows are a DMRows; the foreground QColor, tooltip and italic flag of
+    a row come from the style table given to the constructor. The rows are replaced as a whole by set_rows() with a
+    single model reset, without any per-row objects. Rows marked dirty via set_dirty() show an icon and an extended
+    tooltip.
+    """
+    PathRole = Qt.ItemDataRole.UserRole
+    NameRole = Qt.ItemDataRole.UserRole + 1
+    DirtyRole = Qt.ItemDataRole.UserRole + 2
+    RelPathRole = Qt.ItemDataRole.UserRole + 3
+    IsDirRole = Qt.ItemDataRole.UserRole + 4
+
+    def __init__(self, styles: tuple[tuple[QColor, str, bool], ...], parent=None):
+        """
+        :param styles: (tuple) (foreground QColor, tooltip, italic) per style index used in the rows
+        :param parent: (QObject) Qt parent
+        """
+        super().__init__(parent)
+        self._styles = styles
+        self._rows = DMRows()
+        # row numbers with unsaved changes
+        self._dirty: set[int] = set()
+        self._dirty_icon = QIcon()
+        # text of the single unselectable row shown instead of the rows, e.g. while loading
+        self._placeholder: str | None = None
+        self._italic: QFont | None = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self._placeholder is not None:
+            return 1
+        return len(self._rows)
+
+    def flags(self, index):
+        if not index.isValid() or self._placeholder is not None:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if self._placeholder is not None:
+            return self._placeholder if role == Qt.ItemDataRole.DisplayRole else None
+        row = index.row()
+        rows = self._rows
+        if role == Qt.ItemDataRole.DisplayRole or role == self.NameRole:
+            return rows.names[row]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._styles[rows.styles[row]][0]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            tooltip = self._styles[rows.styles[row]][1]
+            return f"{tooltip} | Unsaved changes" if row in self._dirty else tooltip
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._dirty_icon if row in self._dirty else None
+        if role == Qt.ItemDataRole.FontRole:
+            if not self._styles[rows.styles[row]][2]:
+                return None
+            if self._italic is None:
+                self._italic = QFont()
+                self._italic.setItalic(True)
+            return self._italic
+        if role == self.PathRole:
+            return rows.paths[row]
+        if role == self.RelPathRole:
+            return rows.rel_paths[row]
+        if role == self.IsDirRole:
+            return bool(rows.dirs[row])
+        if role == self.DirtyRole:
+            return row in self._dirty
+        return None
+
+    def set_rows(self, rows: DMRows):
+        """
+        Replaces all rows.
+        :param rows: (DMRows) the rows; kept by reference and not modified
+        :return: no return value
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._dirty = set()
+        self._placeholder = None
+        self.endResetModel()
+
+    def set_placeholder(self, text: str):
+        """
+        Removes all rows and shows text as a single unselectable row instead.
+        :param text: (str) placeholder text
+        :return: no return value
+        """
+        self.beginResetModel()
+        self._rows = DMRows()
+        self._dirty = set()
+        self._placeholder = text
+        self.endResetModel()
+
+    def clear(self):
+        self.set_rows(DMRows())
+
+    def set_dirty(self, dirty_rel_paths: set[str], icon: QIcon):
+        """
+        Marks the rows whose relative path is in dirty_rel_paths as having unsaved changes, and unmarks all others.
+        :param dirty_rel_paths: (set[str]) relative posix paths with unsaved changes
+        :param icon: (QIcon) icon shown for dirty rows
+        :return: no return value
+        """
+        dirty = {row for row, rel_path in enumerate(self._rows.rel_paths) if rel_path in dirty_rel_paths}
+        self._dirty_icon = icon
+        if dirty == self._dirty:
+            return
+        self._dirty = dirty
+        self.dataChanged.emit(
+            self.index(0), self.index(len(self._rows) - 1),
+            [Qt.ItemDataRole.DecorationRole, Qt.ItemDataRole.ToolTipRole, self.DirtyRole]
+        )
+
+
+class GenericIconProvider(QFileIconProvider):
+    """
+    Icon provider for QFileSystemModel that shows the same folder or file icon as LazyDirModel for every entry,
+    instead of looking up the MIME type of each file, which can mean reading its content.
+    """
+    def __init__(self):
+        super().__init__()
+        self.setOptions(QFileIconProvider.Option.DontUseCustomDirectoryIcons)
+        self._dir_icon = super().icon(QFileIconProvider.IconType.Folder)
+        self._file_icon = super().icon(QFileIconProvider.IconType.File)
+
+    def icon(self, info):
+        if isinstance(info, QFileIconProvider.IconType):
+            return super().icon(info)
+        return self._dir_icon if info.isDir() else self._file_icon
+
+
+class _DirNode:
+    """Entry of a LazyDirModel. children is None until the directory has been listed."""
+    __slots__ = ('path', 'name', 'is_dir', 'parent', 'row', 'children', 'pending')
+
+    def __init__(self, path: str, name: str, is_dir: bool, parent: _DirNode | None, row: int):
+        self.path = path
+        self.name = name
+        self.is_dir = is_dir
+        self.parent = parent
+        self.row = row
+        self.children: list[_DirNode] | None = None
+        # listed entries not yet inserted as rows, as (name, path, is_dir)
+        self.pending: list[tuple[str, str, bool]] = []
+
+
+class LazyDirModel(QAbstractItemModel):
+    """
+    Read-only, single-column file system model for the file browser. Unlike QFileSystemModel it never stats entries:
+    directories are listed with os.scandir when the view first expands them, using the file type reported by the
+    directory listing, and their entries are added in pages of PAGE_SIZE rows as the view scrolls (fetchMore). Offers
+    setRootPath() and filePath() like QFileSystemModel; the content of the root path is shown at the top level.
+    """
+    PAGE_SIZE = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root = _DirNode("", "", True, None, 0)
+        provider = QFileIconProvider()
+        self._dir_icon = provider.icon(QFileIconProvider.IconType.Folder)
+        self._file_icon = provider.icon(QFileIconProvider.IconType.File)
+
+    def setRootPath(self, path: str) -> QModelIndex:
+        """
+        Shows the content of path at the top level, discarding all listed directories.
+        :param path: (str) directory to show
+        :return: (QModelIndex) index to pass to QTreeView.setRootIndex
+        """
+        self.beginResetModel()
+        self._root = _DirNode(os.path.abspath(os.path.expanduser(path)), "", True, None, 0)
+        self.endResetModel()
+        return QModelIndex()
+
+    def rootPath(self) -> str:
+        return self._root.path
+
+    def _node(self, index: QModelIndex) -> _DirNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def filePath(self, index: QModelIndex) -> str:
+        return self._node(index).path
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if column != 0 or node.children is None or not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        children = self._node(parent).children
+        return 0 if children is None else len(children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self._node(parent)
+        if not node.is_dir:
+            return False
+        # unlisted directories are assumed to have entries, so that the view offers to expand them
+        return node.children is None or bool(node.children) or bool(node.pending)
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return node.is_dir and (node.children is None or bool(node.pending))
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        if node.children is None:
+            node.children = []
+            node.pending = self._list_dir(node.path)
+        if not node.pending:
+            return
+        batch, node.pending = node.pending[:self.PAGE_SIZE], node.pending[self.PAGE_SIZE:]
+        first = len(node.children)
+        self.beginInsertRows(parent, first, first + len(batch) - 1)
+        node.children.extend(
+            _DirNode(path, name, is_dir, node, first + i) for i, (name, path, is_dir) in enumerate(batch)
+        )
+        self.endInsertRows()
+
+    @staticmethod
+    def _list_dir(path: str) -> list[tuple[str, str, bool]]:
+        """
+        Lists a directory without following symlinks; directories come first, each group sorted by name.
+        :param path: (str) directory to list
+        :return: (list[tuple[str, str, bool]]) entries as (name, path, is directory); empty if unreadable
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = [(e.name, e.path, e.is_dir(follow_symlinks=False)) for e in it]
+        except OSError:
+            return []
+        entries.sort(key=lambda e: (not e[2], e[0].lower()))
+        return entries
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return node.name
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._dir_icon if node.is_dir else self._file_icon
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return node.path
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+
+class _TextPendingEvent(QEvent):
+    """Compact wake-up event posted to a TextBatcher when the first text of a new batch arrives."""
+    EVT = QEvent.Type(QEvent.registerEventType())
+
+    def __init__(self):
+        super().__init__(self.EVT)
+
+
+class TextBatcher(QObject):
+    """
+    Collects text from any thread and emits it through textWritten at most every 33 ms, so that bursts of output
+    result in one signal instead of one per line. Create in the GUI thread; textWritten is then always emitted from
+    the GUI thread and reaches GUI slots as a direct call.
+    """
     textWritten = Signal(str)
+    # oldest text is dropped if producers outpace the GUI; the log view only keeps the last 1000 lines anyway
+    MAX_PENDING = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = collections.deque(maxlen=self.MAX_PENDING)
+        self._lock = threading.Lock()
+        self._timer = QTimer(self)
+        self._timer.setInterval(33)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._emit_pending)
+
+    def queue_text(self, text):
+        with self._lock:
+            first = not self._pending
+            self._pending.append(text)
+        if first:
+            # the timer lives in the GUI thread; wake the batcher up there to start it
+            QCoreApplication.postEvent(self, _TextPendingEvent())
+
+    def customEvent(self, event):
+        if event.type() == _TextPendingEvent.EVT:
+            if not self._timer.isActive():
+                self._timer.start()
+            return
+        super().customEvent(event)
+
+    @Slot()
+    def _emit_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, collections.deque(maxlen=self.MAX_PENDING)
+        if pending:
+            self.textWritten.emit(''.join(pending))
+
+
+class EmittingStream(TextBatcher):
+    """
+    File-like replacement for sys.stdout/sys.stderr that forwards completed lines to textWritten. Set the environment
+    variable DM_GUI_TEE to also copy the output to the original stdout.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # text after the last newline, held back until its line is complete
+        self._carry = ""
+        self._buf_lock = threading.Lock()
+        self._q = None
+        if os.environ.get("DM_GUI_TEE"):
+            # console output is written by a daemon thread, so that callers never block on a slow terminal or pipe
+            self._q = queue.SimpleQueue()
+            threading.Thread(target=self._drain, name="EmittingStream-console", daemon=True).start()
 
     def write(self, text):
-        self.textWritten.emit(str(text))
-        # in addition, write to the original stdout to see console output
-        sys.__stdout__.write(text)
-        self.flush()    # Ensure immediate output
+        if not text:
+            return
+        if type(text) is not str:
+            text = str(text)
+        with self._buf_lock:
+            data = self._carry + text
+            if '\n' not in text:
+                self._carry = data
+                return
+            lines, _, self._carry = data.rpartition('\n')
+        self._forward(lines + '\n')
 
     def flush(self):
-        # Required for file-like objects, but can be empty for this use case
-        pass
+        with self._buf_lock:
+            data, self._carry = self._carry, ""
+        if data:
+            self._forward(data)
+
+    def _forward(self, text):
+        if self._q is not None:
+            self._q.put(text)
+        if text.strip():
+            # drops blank progress-bar refreshes
+            self.queue_text(text)
+
+    def _drain(self):
+        while True:
+            text = self._q.get()
+            if sys.__stdout__ is not None:
+                sys.__stdout__.write(text)
 
     @staticmethod
     def isatty():
@@ -62,50 +504,86 @@ class FirstRunDialog(QDialog):
         self.email_edit = QLineEdit(self)
         layout.addRow("User name:", self.name_edit)
         layout.addRow("User email:", self.email_edit)
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel,
-                                   parent=self)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+        ok_button = QPushButton("OK", self)
+        ok_button.setDefault(True)
+        cancel_button = QPushButton("Cancel", self)
+        ok_button.clicked.connect(self.accept)
+        cancel_button.clicked.connect(self.reject)
+        buttons = QHBoxLayout()
+        buttons.addStretch(1)
+        buttons.addWidget(ok_button)
+        buttons.addWidget(cancel_button)
+        layout.addRow(buttons)
 
     def get_values(self):
         return self.name_edit.text().strip(), self.email_edit.text().strip()
 
 
-class GuiLogHandler(logging.Handler, QObject):
-    # Same signal as EmittingStream
-    textWritten = Signal(str)
+class GuiLogHandler(logging.Handler, TextBatcher):
+    """
+    Forwards log records to the GUI log view via textWritten.
 
+    The formatter is expected to end in a newline, so that formatted records can be emitted without further string
+    concatenation. Log with lazy arguments, e.g. logger.info('x=%s', x), so that message interpolation only happens for
+    records that pass the level check.
+    """
     def __init__(self):
         super().__init__()
-        QObject.__init__(self)
+        TextBatcher.__init__(self)
+        self._fmt = None
+        self.setFormatter(logging.Formatter('%(message)s\n'))
+
+    def setFormatter(self, fmt):
+        super().setFormatter(fmt)
+        # bound once, so that emit() calls the formatter directly instead of going through Handler.format()
+        self._fmt = fmt
 
     def emit(self, record):
-        msg = self.format(record)
-        self.textWritten.emit(msg + '\n')
+        if record.levelno < self.level:
+            return
+        self.queue_text(self._fmt.format(record))
 
 
 class Worker(QRunnable):
-    def __init__(self, fn, *args, **kwargs):
+    """
+    Runs fn(*args, **kwargs) in a thread pool, started with submit(). The worker reports through a long-lived
+    TaggedWorkerSignals object shared by all workers of its owner (e.g. MainWindow._worker_signals, with the workers
+    submitted to MainWindow.pool); its signals carry tag as their first argument, so that the receiver can tell the
+    workers apart.
+    """
+    def __init__(self, fn, *args, signals: TaggedWorkerSignals, tag=None, **kwargs):
         super().__init__()
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
-        self.signals = WorkerSignals()
+        self.tag = tag
+        self.signals = signals
+
+    def submit(self, pool: QThreadPool | None = None):
+        """
+        Starts the worker in pool, by default the global thread pool.
+        :param pool: (QThreadPool | None) thread pool to use
+        :return: no return value
+        """
+        (pool or QThreadPool.globalInstance()).start(self)
 
     @Slot()
     def run(self):
-        self.signals.started.emit()
+        self.signals.started.emit(self.tag)
         try:
             out = self.fn(*self.args, **self.kwargs)
-            self.signals.done.emit(out)
         except Exception as e:
-            self.signals.error.emit(str(e))
-
+            # the exception object (with its __traceback__) is formatted by the receiver, on the GUI thread
+            self.signals.error.emit(self.tag, e)
+            return
+        self.signals.done.emit(self.tag, out)
 
-class WorkerSignals(QObject):
-    started = Signal()
-    done = Signal(object)
-    error = Signal(str)
-    progress = Signal(str)
 
+class TaggedWorkerSignals(QObject):
+    """
+    Signals shared by all workers of one owner, so that submitting a task does not allocate a QObject. Every signal
+    carries the tag of the emitting worker as its first argument. Create in the GUI thread.
+    """
+    started = Signal(object)
+    done = Signal(object, object)
+    error = Signal(object, object)
@@ -1,34 +1,128 @@
 from __future__ import annotations
 
+import collections
 import os
 from datetime import datetime
 import json
 import logging
+import operator
+import queue
+import stat
 import sys
+import traceback
 
+import functools
+import itertools
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt, QThreadPool, Slot, QDir, QTimer, Signal
-from PySide6.QtGui import QPalette, QAction, QColor, QIcon
+from PySide6.QtCore import Qt, QModelIndex, QThreadPool, Slot, QDir, QStringListModel, QTimer, Signal
+from PySide6.QtGui import QAction, QColor, QIcon
 from PySide6.QtWidgets import (
     QAbstractItemView, QApplication, QComboBox, QDialog, QFileDialog, QFileSystemModel,
-    QHBoxLayout, QInputDialog, QLabel, QLineEdit, QListWidget, QListWidgetItem,
-    QMainWindow, QMenu, QMessageBox, QPlainTextEdit, QProgressBar, QPushButton, QTreeView, QSplitter, QStatusBar,
-    QToolBar, QVBoxLayout, QWidget
+    QHBoxLayout, QInputDialog, QLabel, QLineEdit, QListView,
+    QMainWindow, QMenu, QMessageBox, QPlainTextEdit, QProgressBar, QProgressDialog, QPushButton, QTreeView, QSplitter,
+    QStatusBar, QToolBar, QVBoxLayout, QWidget
 )
 
-from roadmap_datamanager.datamanager import DataManager, ALLOWED_CATEGORIES
-from roadmap_datamanager import datalad_gin_api as dgapi
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from core import (
+    DMListModel, DMRows, EmittingStream, FirstRunDialog, GenericIconProvider, GuiLogHandler, LazyDirModel,
+    TaggedWorkerSignals, Worker, create_light_palette, ensure_loaded, lazy_import
+)
+
+# the backend imports DataLad, which takes seconds; it is loaded by bootstrap_datamanager, after the window is shown.
+# Registered before importing remote, which then receives the same lazy module.
+dmm = lazy_import("roadmap_datamanager.datamanager")
+dgapi = lazy_import("roadmap_datamanager.datalad_gin_api")
 
 from remote import GinRemoteDialog
-from core import create_light_palette
-from core import EmittingStream, FirstRunDialog, GuiLogHandler, Worker
 
-METADATA_MANUAL_ADD_ITEMS = [
+if TYPE_CHECKING:
+    from roadmap_datamanager.datamanager import DataManager, InstallSpec
+
+METADATA_MANUAL_ADD_ITEMS = (
     'condition',
     'description',
     'sample',
-]
+)
+
+# (foreground colour, tooltip, italic) of the datamanager panel entries by kind, see MainWindow._dm_classify_entry
+_DM_KIND_STYLES: dict[str, tuple[QColor, str, bool]] = {
+    "dataset": (QColor("#1f6feb"), "Dataset (DataLad/Git)", False),  # blue-ish
+    "folder": (QColor("#237804"), "Folder", False),  # green
+    "file-local": (QColor("#000000"), "Local file", False),  # black
+    # grey, italic as a little visual hint
+    "file-remote": (QColor("#808080"), "Remotely available (annex), content not present", True),
+}
+_DM_OTHER_STYLE = (QColor("#555555"), "Other", False)
+_DM_IGNORED_STYLE = (QColor("red"), "Ignored by dataset .gitignore", False)
+# style table of the DMListModel; rows refer to their style by index
+_DM_STYLES = (*_DM_KIND_STYLES.values(), _DM_OTHER_STYLE, _DM_IGNORED_STYLE)
+_DM_KIND_STYLE_INDEX = {kind: i for i, kind in enumerate(_DM_KIND_STYLES)}
+_DM_OTHER_STYLE_INDEX = len(_DM_KIND_STYLES)
+_DM_IGNORED_STYLE_INDEX = _DM_OTHER_STYLE_INDEX + 1
+
+# max. number of metadata payloads kept in MainWindow._meta_cache
+_META_CACHE_SIZE = 128
+
+# max. number of directory scans kept in MainWindow._listing_cache
+_LISTING_CACHE_SIZE = 32
+
+# from this number of symlinks in a listed directory on, the presence of annexed content is looked up with git-annex
+# in bulk rather than with one stat per symlink
+_DM_ANNEX_QUERY_MIN = 256
+
+# shared by the meta_key combo boxes of all windows; created on first use, once QApplication exists
+_METADATA_KEY_MODEL: QStringListModel | None = None
+
+
+def _metadata_key_model() -> QStringListModel:
+    global _METADATA_KEY_MODEL
+    if _METADATA_KEY_MODEL is None:
+        _METADATA_KEY_MODEL = QStringListModel(list(METADATA_MANUAL_ADD_ITEMS))
+    return _METADATA_KEY_MODEL
+
+
+def _dumps(obj) -> str:
+    """
+    Pretty-prints obj as JSON for the metadata viewer. Uses orjson if it is installed, which serializes several times
+    faster than the json module; both produce an indent of 2.
+    :param obj: JSON-serializable object
+    :return: (str) the JSON text
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # orjson.JSONEncodeError, e.g. for non-str keys, which the json module converts
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _has_dataset_marker(path_str: str) -> bool:
+    """
+    Whether the directory path_str holds an installed DataLad/Git dataset, i.e. contains .git. This is the same
+    criterion as Dataset.is_installed(), at the cost of a single lstat.
+    :param path_str: (str) absolute directory path
+    :return: (bool) True if path_str contains .git
+    """
+    return os.path.lexists(os.path.join(path_str, ".git"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_dataset_dir(path_str: str) -> bool:
+    """
+    Cached _has_dataset_marker; MainWindow._datasets_changed clears it when datasets are created, removed or cloned.
+    :param path_str: (str) absolute directory path
+    :return: (bool) True if path_str holds a dataset
+    """
+    return _has_dataset_marker(path_str)
 
 
 class MainWindow(QMainWindow):
@@ -49,24 +143,39 @@ class MainWindow(QMainWindow):
 
         self._create_menubar()
         self._create_split_view()
+        # runs once the event loop is up, i.e. after the first paint
+        QTimer.singleShot(0, self._populate_fs_panel)
+
+        # log view text is collected and appended at most every 50 ms
+        self._log_buf: list[str] = []
+        self._log_flush_pending = False
 
         # --- Redirect stdout/stderr ---
         self.stdout_redirect = EmittingStream()
-        self.stdout_redirect.textWritten.connect(self.logviewer_append_text)
+        # textWritten is emitted by the batching timer in the GUI thread; queued all the same, so that appending to the
+        # log view never runs inside an emitting call stack, whichever thread it is on
+        self.stdout_redirect.textWritten.connect(self.logviewer_append_text, Qt.ConnectionType.QueuedConnection)
         sys.stdout = self.stdout_redirect
         sys.stderr = self.stdout_redirect
 
         # --- Redirect Logging to GUI ---
+        # Records are handed to a queue by the logging threads and formatted by a single listener thread, which
+        # feeds the GUI handler.
         log_handler = GuiLogHandler()
-        log_handler.textWritten.connect(self.logviewer_append_text)
+        log_handler.textWritten.connect(self.logviewer_append_text, Qt.ConnectionType.QueuedConnection)
         formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s\n'
         )
         log_handler.setFormatter(formatter)
+        self._log_handler = log_handler
+        log_queue = queue.Queue(-1)
+        self._log_queue_handler = QueueHandler(log_queue)
+        self._log_listener = QueueListener(log_queue, log_handler, respect_handler_level=True)
+        self._log_listener.start()
 
         # Attach handler ONLY to the root logger
         root_logger = logging.getLogger()
-        root_logger.addHandler(log_handler)
+        root_logger.addHandler(self._log_queue_handler)
         root_logger.setLevel(logging.INFO)
 
         # Configure datalad logger to propagate upwards
@@ -76,12 +185,43 @@ class MainWindow(QMainWindow):
         # do not add log_handler here
         # dl_logger.addHandler(log_handler)
 
+        # (dataset root, relative posix path or None) -> metadata payload, least recently used first
+        self._meta_cache: collections.OrderedDict[tuple[str, str | None], dict] = collections.OrderedDict()
+
         # metadata update delay timer
         self._meta_update_timer = QTimer(self)
         self._meta_update_timer.setSingleShot(True)
         self._meta_update_timer.timeout.connect(self._dm_update_metadata_for_current_selection)
         self._pending_meta_item = None
 
+        # generation of the latest datamanager panel scan; results of older scans are dropped
+        self._scan_gen = 0
+        # generation of the latest metadata load, likewise
+        self._meta_gen = 0
+        # icon of rows with unsaved changes, see _dm_apply_dirty_item_markers
+        self._dirty_icon: QIcon | None = None
+        # directory -> enclosing dataset root, filled by _find_dataset_root_and_rel and by the panel scans; cleared as a
+        # whole by _datasets_changed, i.e. when datasets change and on every forced refresh
+        self._ds_root_for_child: dict[str, Path] = {}
+        # (path, inode, mtime) of the directory listed in the datamanager panel, see dm_refresh_panel
+        self._shown_listing: tuple[Path, int, int] | None = None
+        # (path, inode, mtime) -> result of _dm_scan_dir, least recently used first; revisited directories that did not
+        # change are shown without a scan
+        self._listing_cache: collections.OrderedDict[
+            tuple[Path, int, int], tuple[DMRows, dict[str, Path]]
+        ] = collections.OrderedDict()
+        # set while sync_with_gin pulls, to ignore further requests
+        self._sync_running = False
+        # (datamanager, path, result) of the last _dm_current_level call
+        self._level_cache: tuple[DataManager, Path, tuple] | None = None
+
+        # coalesces bursts of dm_refresh_panel calls into one panel refresh; force if any of the calls forced
+        self._refresh_force = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._dm_refresh_panel_now)
+
         # Background check state for global save-button updates
         self._branch_check_running = False
         self._branch_check_requested = False
@@ -107,16 +247,23 @@ class MainWindow(QMainWindow):
         self.remote_state = {}
         self.remote_check_intervall = 1200
 
-        # bootstrap DM
-        self.bootstrap_datamanager()
-
         # state for current metadata context
         self.meta_current_ds_root: Path | None = None
         self.meta_current_rel: str | None = None  # posix path or None for dataset
         self.meta_current_payload: dict | None = None  # extracted_metadata being edited
+        # top-level key -> its pretty-printed lines in meta_view, so that an edit re-serializes only one key
+        self._meta_blocks: dict[str, str] = {}
 
         # Track how many workers are currently running
         self._active_workers = 0
+        # one signals object for all workers started by _run_in_worker; emissions are routed by the worker's tag
+        self._worker_signals = TaggedWorkerSignals(self)
+        self._worker_signals.started.connect(self._on_worker_started)
+        self._worker_signals.done.connect(self._on_worker_done)
+        self._worker_signals.error.connect(self._on_worker_error)
+        # tag -> (refresh, on_done, on_error) of the running workers
+        self._worker_tasks: dict[int, tuple] = {}
+        self._worker_tags = itertools.count()
 
         # Busy indicator (can be anywhere: toolbar, layout, etc.)
         self.busy_bar = QProgressBar(self)
@@ -126,10 +273,27 @@ class MainWindow(QMainWindow):
         # add to status bar:
         self.statusBar().addPermanentWidget(self.busy_bar)
 
+        # bootstrap DM; last, as it starts workers. Deferred to the event loop, so that the window is shown before the
+        # backend is imported
+        QTimer.singleShot(0, self.bootstrap_datamanager)
+
     def _choose_browser_root(self):
-        path = QFileDialog.getExistingDirectory(self, "Select folder to browse")
+        path = self._get_existing_directory("Select folder to browse")
         if path:
-            self.fs_tree.setRootIndex(self.fs_model.index(path))
+            self._set_fs_root(path)
+
+    def _get_existing_directory(self, caption: str) -> str:
+        """
+        Asks for a directory without resolving symlinks or looking up custom folder icons, which cost syscalls per
+        entry on network file systems. Uses the native dialog unless the configuration disables it.
+        :param caption: (str) dialog title
+        :return: (str) the chosen directory, or an empty string if the dialog was cancelled
+        """
+        options = (QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks
+                   | QFileDialog.Option.DontUseCustomDirectoryIcons)
+        if self.dm is not None and not self.dm.cfg.use_native_file_dialog:
+            options |= QFileDialog.Option.DontUseNativeDialog
+        return QFileDialog.getExistingDirectory(self, caption, "", options)
 
     def _create_menubar(self):
         menubar = self.menuBar()
@@ -160,6 +324,49 @@ class MainWindow(QMainWindow):
         act_publish_all_GIN.triggered.connect(self.dm_publish_new_repository_to_GIN_remote)
         remote_menu.addAction(act_publish_all_GIN)
 
+    def _populate_fs_panel(self):
+        """
+        Creates the file system model of the file browser and shows the home directory. Does nothing if the model
+        already exists. Uses the lazy LazyDirModel unless the configuration asks for QFileSystemModel; as this runs
+        before the datamanager is loaded, set_datamanager applies the configured model type again.
+        :return: no return value
+        """
+        if self.fs_model is not None:
+            return
+        self._set_fs_model(self.dm is not None and self.dm.cfg.use_qt_file_system_model)
+
+    def _set_fs_model(self, use_qt_file_system_model: bool):
+        """
+        Makes the file browser use QFileSystemModel or LazyDirModel. Nothing happens if the current model is already of
+        that type. A replaced model keeps its root directory; a new one starts at the home directory.
+        :param use_qt_file_system_model: (bool) True for QFileSystemModel, False for LazyDirModel
+        :return: no return value
+        """
+        old_model = self.fs_model
+        if old_model is not None and isinstance(old_model, QFileSystemModel) == use_qt_file_system_model:
+            return
+        root = old_model.rootPath() if old_model is not None else QDir.homePath()
+        if use_qt_file_system_model:
+            self.fs_model = QFileSystemModel(self)
+            # no file watchers, symlink resolution, custom folder icons or per-file type icons: each costs syscalls
+            # per entry, which is slow on network home directories
+            self.fs_model.setOption(QFileSystemModel.Option.DontWatchForChanges, True)
+            self.fs_model.setOption(QFileSystemModel.Option.DontResolveSymlinks, True)
+            self._fs_icon_provider = GenericIconProvider()
+            self.fs_model.setIconProvider(self._fs_icon_provider)
+            self.fs_model.setReadOnly(True)
+        else:
+            self.fs_model = LazyDirModel(self)
+
+        self.fs_tree.setModel(self.fs_model)
+        if old_model is not None:
+            old_model.deleteLater()
+        self.fs_tree.setColumnWidth(0, 280)
+        # size, type and date columns would need a stat() per visible row
+        for column in (1, 2, 3):
+            self.fs_tree.setColumnHidden(column, True)
+        self._set_fs_root(root)
+
     def _create_split_view(self):
         splitter = QSplitter()
         splitter.setOrientation(Qt.Orientation.Horizontal)
@@ -181,17 +388,12 @@ class MainWindow(QMainWindow):
         tb.addAction(act_install)
         fs_layout.addWidget(tb)
 
-        self.fs_model = QFileSystemModel()
-        self.fs_model.setRootPath(QDir.homePath())
-        self.fs_model.setReadOnly(True)
-
+        # the model is attached by _populate_fs_panel after the window is first shown, so that the directory scan of
+        # the home folder does not delay startup
+        self.fs_model: QFileSystemModel | None = None
         self.fs_tree = QTreeView()
-        self.fs_tree.setModel(self.fs_model)
-        self.fs_tree.setRootIndex(self.fs_model.index(QDir.homePath()))
         self.fs_tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.fs_tree.setSortingEnabled(True)
-        self.fs_tree.sortByColumn(0, Qt.SortOrder.AscendingOrder)
-        self.fs_tree.setColumnWidth(0, 280)
+        self.fs_tree.setUniformRowHeights(True)
         fs_layout.addWidget(self.fs_tree, 1)
 
         splitter.addWidget(self.fs_panel)
@@ -224,7 +426,7 @@ class MainWindow(QMainWindow):
         self.btn_save_all = QPushButton("Save Dataset")
 
         self.btn_up.clicked.connect(self.dm_go_up)
-        self.btn_refresh.clicked.connect(self.dm_refresh_panel)
+        self.btn_refresh.clicked.connect(lambda: self.dm_refresh_panel(force=True))
         self.btn_new_dataset.clicked.connect(self.dm_create_dataset_here)
 
         self.btn_save_all.setEnabled(False)
@@ -261,14 +463,18 @@ class MainWindow(QMainWindow):
         dm_layout.addLayout(remote_row)
 
         # list of children at current level
-        self.dm_list = QListWidget()
-        self.dm_list.itemActivated.connect(self._dm_open_item)
+        self.dm_model = DMListModel(_DM_STYLES, self)
+        self.dm_list = QListView()
+        self.dm_list.setModel(self.dm_model)
+        self.dm_list.setUniformItemSizes(True)
+        # lays out long listings in batches between events instead of all rows at once
+        self.dm_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.dm_list.activated.connect(self._dm_open_item)
         self.dm_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.dm_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.dm_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.dm_list.customContextMenuRequested.connect(self._dm_context_menu)
-        self.dm_list.setSortingEnabled(True)
-        self.dm_list.itemSelectionChanged.connect(self._dm_selection_changed)
+        self.dm_list.selectionModel().selectionChanged.connect(self._dm_selection_changed)
         dm_layout.addWidget(self.dm_list, 1)
 
         splitter.addWidget(self.dm_panel)
@@ -288,7 +494,7 @@ class MainWindow(QMainWindow):
         editor_row = QHBoxLayout()
         self.meta_key = QComboBox()
         self.meta_key.setEditable(True)
-        self.meta_key.addItems(METADATA_MANUAL_ADD_ITEMS)
+        self.meta_key.setModel(_metadata_key_model())
         self.meta_value = QLineEdit()
         self.meta_apply_btn = QPushButton("Add/Update")
         self.meta_save_btn = QPushButton("Save to dataset")
@@ -328,32 +534,10 @@ class MainWindow(QMainWindow):
         """
         Mark direct children of the current dataset that have unsaved changes.
         """
-        dirty_icon = self.style().standardIcon(self.style().StandardPixmap.SP_BrowserReload)
-
-        for row in range(self.dm_list.count()):
-            item = self.dm_list.item(row)
-            # item_name = item.data(Qt.ItemDataRole.UserRole + 1)
-            item_relpath = item.data(Qt.ItemDataRole.UserRole + 3)
-            is_dirty = str(item_relpath) in dirty_names
-            item.setData(Qt.ItemDataRole.UserRole + 2, is_dirty)
-
-            if is_dirty:
-                item.setIcon(dirty_icon)
-                tooltip = item.toolTip() or ""
-                if "Unsaved changes" not in tooltip:
-                    if tooltip:
-                        tooltip = f"{tooltip} | Unsaved changes"
-                    else:
-                        tooltip = "Unsaved changes"
-                    item.setToolTip(tooltip)
-            else:
-                item.setIcon(QIcon())
-                tooltip = item.toolTip() or ""
-                tooltip = tooltip.replace(" | Unsaved changes", "")
-                tooltip = tooltip.replace("Unsaved changes | ", "")
-                if tooltip == "Unsaved changes":
-                    tooltip = ""
-                item.setToolTip(tooltip)
+        # looked up once, like the shared row colors and italic font
+        if self._dirty_icon is None:
+            self._dirty_icon = self.style().standardIcon(self.style().StandardPixmap.SP_BrowserReload)
+        self.dm_model.set_dirty(dirty_names, self._dirty_icon)
 
     @Slot(str, object)
     def _dm_apply_remote_state(self, key: str, entry: object):
@@ -597,7 +781,7 @@ class MainWindow(QMainWindow):
 
 
     @staticmethod
-    def _dm_classify_entry(path: Path) -> str:
+    def _dm_classify_entry(entry: os.DirEntry, presence: dict[str, bool] | None = None) -> str:
         """
         Return one of:
           - "dataset"         (directory that looks like a DataLad/Git dataset)
@@ -605,30 +789,37 @@ class MainWindow(QMainWindow):
           - "file-local"      (regular file OR symlink whose target exists)
           - "file-remote"     (symlink whose target does NOT exist — typical dropped annex content)
           - "other"
+        Uses the file type cached in the scandir entry; only symlinks and directories cost further syscalls.
+        :param entry: (os.DirEntry) the directory entry
+        :param presence: (dict[str, bool] | None) content presence of annexed files by name, see dgapi.annex_presence;
+                         annexed symlinks found in it are classified without a stat
         """
-        if path.is_dir():
+        is_dir = entry.is_dir(follow_symlinks=False)
+        if not is_dir and entry.is_symlink():
+            if presence is not None and entry.name in presence:
+                return "file-local" if presence[entry.name] else "file-remote"
+            # for annexed content: symlink may point to non-existing target (dropped)
+            try:
+                st = os.stat(entry.path)
+            except OSError:
+                return "file-remote"
+            if not stat.S_ISDIR(st.st_mode):
+                return "file-local"
+            is_dir = True
+
+        if is_dir:
             # dataset?
-            if (path / ".datalad").exists() or (path / ".git").exists():
+            if _has_dataset_marker(entry.path):
                 return "dataset"
             return "folder"
 
-        # files / symlinks
-        if path.is_symlink():
-            # for annexed content: symlink may point to non-existing target (dropped)
-            target = path.resolve(strict=False)
-            if target.exists():
-                return "file-local"
-            else:
-                return "file-remote"
-
-        if path.is_file():
+        if entry.is_file(follow_symlinks=False):
             return "file-local"
 
         return "other"
 
     def _dm_context_menu(self, pos):
-        items = self.dm_list.selectedItems()
-        if not items:
+        if not self.dm_list.selectionModel().hasSelection():
             return
 
         menu = QMenu(self)
@@ -677,35 +868,120 @@ class MainWindow(QMainWindow):
         ds_path = None
         if self.dm is None or self.dm_current_path is None:
             return level, pcec, ds_path
-        else:
-            return self.dm.get_level(self.dm_current_path)
-
-    def _dm_open_item(self, item: QListWidgetItem):
-        path_str = item.data(Qt.ItemDataRole.UserRole)
+        # several handlers ask for the level of the same path in a row; get_level resolves paths on every call
+        cached = self._level_cache
+        if cached is not None and cached[0] is self.dm and cached[1] == self.dm_current_path:
+            return cached[2]
+        result = self.dm.get_level(self.dm_current_path)
+        self._level_cache = (self.dm, self.dm_current_path, result)
+        return result
+
+    def _dm_open_item(self, index: QModelIndex):
+        path_str = index.data(DMListModel.PathRole)
         if not path_str:
             return
-        p = Path(path_str)
-        if p.is_dir():
-            self.dm_current_path = p
+        # the scan already classified the item; no stat on the GUI thread
+        if index.data(DMListModel.IsDirRole):
+            self.dm_current_path = Path(path_str)
             self.dm_refresh_panel()
         # else: it's a file/symlink — ignore or handle later (open in Finder, fetch annex, etc.)
 
 
     @Slot()
+    def _dm_populate_list(self, gen: int, rows: DMRows, ds_dirs: dict[str, Path]):
+        """
+        Fills the datamanager list with the rows of a directory scan.
+        :param gen: (int) scan generation the rows belong to; results of superseded scans are discarded
+        :param rows: (DMRows) model rows as returned by _dm_scan_dir
+        :param ds_dirs: (dict[str, Path]) directory -> dataset root map as returned by _dm_scan_dir
+        :return: no return value
+        """
+        if gen != self._scan_gen:
+            return
+
+        # selected children then resolve against the dataset of the listed directory without a climb
+        self._ds_root_for_child.update(ds_dirs)
+
+        # a single model reset for all rows; the rows come sorted and styled from _dm_scan_dir, so that nothing per
+        # row is left for the GUI thread
+        self.dm_model.set_rows(rows)
+        self._dm_check_branch_scheduler()
+
+    @classmethod
+    def _dm_scan_dir(cls, path: Path, parentds_path: Path) -> tuple[DMRows, dict[str, Path]]:
+        """
+        Lists and classifies the children of path, and finds the dataset enclosing path. Runs in a worker thread;
+        touches no widgets.
+        :param path: (Path) directory to list
+        :param parentds_path: (Path) dataset containing path
+        :return: (DMRows, dict[str, Path]) DMListModel rows with paths relative to parentds_path and indexes into
+                 _DM_STYLES, and every directory from path up to its dataset root mapped to that root (empty if there
+                 is no enclosing dataset), for MainWindow._ds_root_for_child
+        """
+        # .gitignore is read once for all children
+        gitignore_patterns = dgapi.read_gitignore(parentds_path)
+        path = path.expanduser().resolve()
+        # the relative posix path is joined per child as a string, instead of a relative_to per child
+        rel_base = path.relative_to(parentds_path).as_posix()
+        rel_prefix = "" if rel_base == "." else rel_base + "/"
+        with os.scandir(path) as it:
+            # still skip dot dirs/files, before any stat
+            entries = [entry for entry in it if not entry.name.startswith(".")]
+        # sorted here rather than by the view, which keeps the sort off the GUI thread
+        entries.sort(key=operator.attrgetter("name"))
+        # symlinks are known from the scandir file type without a syscall
+        links = [entry.name for entry in entries if entry.is_symlink()]
+        presence = dgapi.annex_presence(path, links) if len(links) >= _DM_ANNEX_QUERY_MIN else None
+
+        rows = DMRows()
+        for entry in entries:
+            kind = cls._dm_classify_entry(entry, presence)
+            is_dir = kind in ("dataset", "folder")
+            # color-code; without patterns nothing is ignored, and no Path is needed for the check
+            if gitignore_patterns and dgapi.is_gitignored(parentds_path, Path(entry.path),
+                                                          patterns=gitignore_patterns, is_dir=is_dir):
+                style = _DM_IGNORED_STYLE_INDEX
+            else:
+                style = _DM_KIND_STYLE_INDEX.get(kind, _DM_OTHER_STYLE_INDEX)
+            rows.append(entry.name, entry.path, rel_prefix + entry.name, style, is_dir)
+        return rows, cls._dm_dataset_dirs(str(path))
+
+    @staticmethod
+    def _dm_dataset_dirs(dir_str: str) -> dict[str, Path]:
+        """
+        Walks up from a resolved directory to the enclosing dataset, like _find_dataset_root_and_rel, but without its
+        caches, so that it can run in a worker thread.
+        :param dir_str: (str) resolved directory path
+        :return: (dict[str, Path]) every directory passed on the way up mapped to the dataset root, empty if there is
+                 no enclosing dataset
+        """
+        visited = []
+        p = dir_str
+        while True:
+            visited.append(p)
+            if _has_dataset_marker(p):
+                return dict.fromkeys(visited, Path(p))
+            parent = os.path.dirname(p)
+            if parent == p:
+                return {}
+            p = parent
+
     def _dm_selection_changed(self):
-        items = self.dm_list.selectedItems()
+        indexes = self.dm_list.selectionModel().selectedIndexes()
 
         # Empty or multi-selection: clear metadata view and stop any pending load
-        if len(items) != 1:
+        if len(indexes) != 1:
             if hasattr(self, "meta_view"):
                 self.meta_view.clear()
                 # Optionally show a hint instead of pure empty:
                 # self.meta_view.setPlainText("Select a single item to view metadata.")
             self._pending_meta_item = None
             self._meta_update_timer.stop()
+            # drop metadata still being loaded for the previous selection
+            self._meta_gen += 1
             return
 
-        self._pending_meta_item = items[0]
+        self._pending_meta_item = indexes[0]
         # Debounce: restart the timer each time selection changes
         self._meta_update_timer.start(300)  # ms; tweak as desired
 
@@ -747,8 +1023,7 @@ class MainWindow(QMainWindow):
     @Slot()
     def _dm_update_metadata_for_current_selection(self):
         # If selection changed again during the delay, re-check
-        items = self.dm_list.selectedItems()
-        if len(items) != 1:
+        if len(self.dm_list.selectionModel().selectedIndexes()) != 1:
             if hasattr(self, "meta_view"):
                 self.meta_view.clear()
             return
@@ -756,51 +1031,144 @@ class MainWindow(QMainWindow):
         # Call your existing method which relies on the current selection
         self.dm_show_selected_metadata()
 
+    def _find_dataset_root_and_rel(self, path: str | os.PathLike | Path) -> tuple[Path | None, Path | None]:
+        """
+        Cached variant of dgapi.find_dataset_root_and_rel for selection actions. Dataset checks are memoized per
+        directory and every directory passed on the way up is mapped to the dataset root found, so that siblings
+        resolve without climbing again. _datasets_changed clears the whole map, on every forced refresh among others;
+        the next panel scan maps the listed directory again (see _dm_scan_dir), so that its children resolve without
+        a climb once the scan has been shown.
+        :param path: (Path or str) item path to start walking up from
+        :return: (Path | None, Path | None) dataset root and path relative to it (None for the root itself), or
+                 (None, None) if there is no enclosing dataset
+        """
+        # the walk works on strings; Paths are only built for the result
+        path_str = os.path.realpath(path)
+        try:
+            # after realpath, lstat only differs from stat for a dangling symlink, which counts as existing
+            st = os.lstat(path_str)
+        except OSError:
+            return None, None
+
+        p = path_str if stat.S_ISDIR(st.st_mode) else os.path.dirname(path_str)
+        ds_root = None
+        visited = []
+        while True:
+            ds_root = self._ds_root_for_child.get(p)
+            if ds_root is not None:
+                break
+            visited.append(p)
+            if _is_dataset_dir(p):
+                ds_root = Path(p)
+                break
+            parent = os.path.dirname(p)
+            if parent == p:
+                break
+            p = parent
+
+        if ds_root is None:
+            return None, None
+        for dir_str in visited:
+            self._ds_root_for_child[dir_str] = ds_root
+        root_str = str(ds_root)
+        return ds_root, None if path_str == root_str else Path(os.path.relpath(path_str, root_str))
+
+    def _datasets_changed(self):
+        """
+        Drops the cached dataset checks and the directory -> dataset root map of _find_dataset_root_and_rel. Call when
+        datasets are created, removed or cloned.
+        :return: no return value
+        """
+        _is_dataset_dir.cache_clear()
+        self._ds_root_for_child.clear()
+
     def _go_home(self):
         home = QDir.homePath()
-        self.fs_tree.setRootIndex(self.fs_model.index(home))
+        self._set_fs_root(home)
 
-    def _run_in_worker(self, fn, refresh: str | None ='dm', *args, **kwargs):
+    @staticmethod
+    def _group_by_dataset(paths: list[tuple[Path, str]]) -> dict[Path, list[str]]:
+        """
+        Groups (dataset root, relative path) pairs as returned by _selected_dm_paths by dataset root.
+        :param paths: (list[tuple[Path, str]]) selected paths
+        :return: (dict[Path, list[str]]) relative paths per dataset root, in selection order
+        """
+        groups: dict[Path, list[str]] = collections.defaultdict(list)
+        for ds_root, rel_str in paths:
+            groups[ds_root].append(rel_str)
+        return groups
+
+    def _run_in_worker(self, fn, refresh: str | None ='dm', *args, on_done=None, on_error=None, **kwargs):
         """
         Runs a function in a worker thread and refreshes the panel indicated by the refresh argument
         :param fn: the function to run
         :param refresh: (str) 'dm' (default) for the datamanager panel, 'mt' for the metadata panel
         :param args: function argument
+        :param on_done: (callable | None) called with the return value of fn on the GUI thread
+        :param on_error: (callable | None) called with the exception raised by fn on the GUI thread
         :param kwargs: keyword function arguments
         :return: no return value
         """
-        worker = Worker(fn, *args, **kwargs)
-        # pipe worker error to log
-        worker.signals.error.connect(
-            lambda msg: self.logviewer_append_text(f"[ERROR] {msg}\n")
-        )
-
-        # Indicate when worker starts / finishes
-        worker.signals.started.connect(self._worker_started)
-        worker.signals.done.connect(self._worker_finished)
-        worker.signals.error.connect(lambda _msg: self._worker_finished())
-
+        tag = next(self._worker_tags)
+        self._worker_tasks[tag] = (refresh, on_done, on_error)
+        Worker(fn, *args, signals=self._worker_signals, tag=tag, **kwargs).submit(self.pool)
+
+    @Slot(object)
+    def _on_worker_started(self, _tag):
+        self._worker_started()
+
+    @Slot(object, object)
+    def _on_worker_done(self, tag, out):
+        refresh, on_done, _ = self._worker_tasks.pop(tag)
+        self._worker_finished()
         # Trigger widget update when worker is done
-        if refresh is None:
-            pass
-        elif refresh == 'dm':
-            worker.signals.done.connect(self.dm_refresh_panel)
+        if refresh == 'dm':
+            # the worker may have created or removed datasets
+            self._datasets_changed()
+            self.dm_refresh_panel(force=True)
         elif refresh == 'mt':
-            worker.signals.done.connect(self.dm_show_selected_metadata)
-        self.pool.start(worker)
+            self.dm_show_selected_metadata()
+        if on_done is not None:
+            on_done(out)
+
+    @Slot(object, object)
+    def _on_worker_error(self, tag, exc):
+        _, _, on_error = self._worker_tasks.pop(tag)
+        # pipe worker error to log
+        self._worker_error(exc)
+        self._worker_finished()
+        if on_error is not None:
+            on_error(exc)
+
+    def _set_fs_root(self, path: str):
+        """
+        Shows path as the root of the file browser. For QFileSystemModel, sorting is suspended while the root changes,
+        so that the view sorts the new children once instead of while they are being fetched.
+        :param path: (str) directory to show
+        :return: no return value
+        """
+        self._populate_fs_panel()
+        if not isinstance(self.fs_model, QFileSystemModel):
+            # LazyDirModel lists directories sorted
+            self.fs_tree.setRootIndex(self.fs_model.setRootPath(path))
+            return
+        self.fs_tree.setSortingEnabled(False)
+        self.fs_tree.setRootIndex(self.fs_model.setRootPath(path))
+        self.fs_tree.setSortingEnabled(True)
+        self.fs_tree.sortByColumn(0, Qt.SortOrder.AscendingOrder)
 
     def _selected_dm_paths(self):
         paths: list[Path] = []
-        for item in self.dm_list.selectedItems():
-            path_str = item.data(Qt.ItemDataRole.UserRole)
+        for index in self.dm_list.selectionModel().selectedIndexes():
+            path_str = index.data(DMListModel.PathRole)
             if path_str:
                 paths.append(Path(path_str))
 
         paths2 = []
         for p in paths:
-            ds_root, rel = dgapi.find_dataset_root_and_rel(p)
-            if ds_root is not None and rel is not None:
-                paths2.append((ds_root, rel.as_posix()))
+            ds_root, rel = self._find_dataset_root_and_rel(p)
+            if ds_root is not None:
+                paths2.append((ds_root, "." if rel is None else rel.as_posix()))
 
         return paths2
 
@@ -810,6 +1178,18 @@ class MainWindow(QMainWindow):
             self.busy_bar.setVisible(True)
             # QApplication.setOverrideCursor(Qt.BusyCursor)
 
+    def _worker_error(self, exc: BaseException):
+        """
+        Logs the exception raised in a worker. The traceback is only formatted when debug logging is enabled.
+        :param exc: (BaseException) the exception, including its __traceback__
+        :return: no return value
+        """
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            text = ''.join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        else:
+            text = ''.join(traceback.format_exception_only(type(exc), exc))
+        self.logviewer_append_text(f"[ERROR] {text}")
+
     def _worker_finished(self):
         if self._active_workers > 0:
             self._active_workers -= 1
@@ -834,12 +1214,13 @@ class MainWindow(QMainWindow):
 
         if self.meta_current_payload is None:
             self.meta_current_payload = {}
+            self._meta_blocks = {}
 
         # simple flat update; nested keys can be handled later if needed
         self.meta_current_payload[key] = value
 
         # reflect changes in viewer immediately
-        self.metadata_update_viewer()
+        self.metadata_update_viewer(key=key)
         self.meta_value.clear()
 
     def bootstrap_datamanager(self):
@@ -847,8 +1228,10 @@ class MainWindow(QMainWindow):
         Try to load a persistent config at GUI startup
         :return: no return value
         """
+        # load the backend here, on the GUI thread, before any worker can touch it
+        ensure_loaded(dmm, dgapi)
         try:
-            dm = DataManager.from_persisted()
+            dm = dmm.DataManager.from_persisted()
         except FileNotFoundError:
             # no persistent configuration yet — ask for root
             self.status.showMessage("No persisted datamanager yet — please select a root.")
@@ -857,6 +1240,14 @@ class MainWindow(QMainWindow):
         else:
             self.set_datamanager(dm)
 
+    def closeEvent(self, event):
+        # stop the log listener thread and hand stdout/stderr back before the widgets go away
+        logging.getLogger().removeHandler(self._log_queue_handler)
+        self._log_listener.stop()
+        sys.stdout = sys.__stdout__
+        sys.stderr = sys.__stderr__
+        super().closeEvent(event)
+
     def clone_from_gin(self):
         """
         Clones the GIN superdataset into an empty datamanager directory
@@ -864,6 +1255,7 @@ class MainWindow(QMainWindow):
         """
         if self.dm is None:
             return
+        self._datasets_changed()
         self._run_in_worker(
             self.dm.clone_from_remote,
             dest=self.dm_current_path
@@ -875,7 +1267,7 @@ class MainWindow(QMainWindow):
         """
         if self.dm_current_path is None:
             return None
-        ds_path, _ = dgapi.find_dataset_root_and_rel(Path(self.dm_current_path).expanduser().resolve())
+        ds_path, _ = self._find_dataset_root_and_rel(Path(self.dm_current_path).expanduser())
         if ds_path is None:
             return None
         return Path(ds_path).expanduser().resolve()
@@ -935,6 +1327,7 @@ class MainWindow(QMainWindow):
         if not ok or not name.strip():
             return
         name = name.strip()
+        self._datasets_changed()
 
         # call datamanager
         if level == "root":
@@ -956,42 +1349,28 @@ class MainWindow(QMainWindow):
         paths = self._selected_dm_paths()
         if not paths:
             return
-        for ds_root, rel_str in paths:
-            p = str(ds_root) + ':' + str(rel_str)
-            try:
-                self._run_in_worker(
-                    dgapi.drop_content,
-                    dataset=str(ds_root),
-                    path=rel_str,
-                    what="filecontent",
-                    recursive=False
-                )
-                self.logviewer_append_text(f"[INFO] Dropped content: {p}\n")
-            except Exception as e:
-                self.logviewer_append_text(f"[WARN] Could not drop {p}: {e}\n")
-        self.dm_refresh_panel()
+        # one worker (and one git-annex call) per dataset
+        jobs = [
+            (str(ds_root) + ':' + ', '.join(rel_strs), dgapi.drop_content,
+             dict(dataset=str(ds_root), path=rel_strs, recursive=False))
+            for ds_root, rel_strs in self._group_by_dataset(paths).items()
+        ]
+        self._run_batch(jobs, done_text="Dropped content", fail_text="drop")
 
     def dm_get_from_remote(self, recursive=False):
         paths = self._selected_dm_paths()
         if not paths:
             return
-        for ds_root, rel_str in paths:
-            p = str(ds_root) + ':' + str(rel_str)
-            if rel_str == '.':
+        # one worker (and one git-annex call) per dataset
+        jobs = []
+        for ds_root, rel_strs in self._group_by_dataset(paths).items():
+            if '.' in rel_strs:
                 path = None
             else:
-                path = str(Path(ds_root) / Path(rel_str))
-            try:
-                self._run_in_worker(
-                    dgapi.get_content,
-                    dataset=str(ds_root),
-                    path=path,
-                    recursive=recursive
-                )
-                self.logviewer_append_text(f"[INFO] Got content: {p}\n")
-            except Exception as e:
-                self.logviewer_append_text(f"[WARN] Could not get {p}: {e}\n")
-        self.dm_refresh_panel()
+                path = [str(Path(ds_root) / Path(rel_str)) for rel_str in rel_strs]
+            jobs.append((str(ds_root) + ':' + ', '.join(rel_strs), dgapi.get_content,
+                         dict(dataset=str(ds_root), path=path, recursive=recursive)))
+        self._run_batch(jobs, done_text="Got content", fail_text="get")
 
     def dm_go_up(self):
         if self.dm is None or self.dm_current_path is None:
@@ -1002,10 +1381,7 @@ class MainWindow(QMainWindow):
         self.dm_refresh_panel()
 
     def dm_open_selected(self):
-        item = self.dm_list.currentItem()
-        if not item:
-            return
-        path_str = item.data(Qt.ItemDataRole.UserRole)
+        path_str = self.dm_list.currentIndex().data(DMListModel.PathRole)
         if not path_str:
             return
         p = Path(path_str)
@@ -1067,13 +1443,32 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 self.logviewer_append_text(f"[WARN] Could not GIN publish {p}: {e}\n")
 
-    def dm_refresh_panel(self):
+    def dm_refresh_panel(self, force: bool = False):
         """
-        Refresh the data manager panel.
+        Schedules a refresh of the data manager panel. Calls within 50 ms, e.g. from several actions finishing
+        together, are collapsed into a single refresh.
+        :param force: (bool) rescan even if the directory looks unchanged, e.g. after annex content was dropped
         :return: no return value
         """
-        # halt previous branch check not yet started
-        self._check_branch_timer.stop()
+        self._refresh_force = self._refresh_force or force
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _dm_refresh_panel_now(self):
+        """
+        Refresh the data manager panel. The list is only scanned again if the current directory changed since it was
+        listed, judged by its modification time, or if one of the collapsed dm_refresh_panel calls forced it. An
+        unchanged directory listed before is shown from the listing cache without a scan.
+        :return: no return value
+        """
+        force, self._refresh_force = self._refresh_force, False
+        if force:
+            # forced refreshes follow actions that may have written metadata, e.g. installs or pulls, or changed
+            # content presence, which leaves the directory modification times unchanged
+            self._meta_cache.clear()
+            self._listing_cache.clear()
+            # datasets may also have been created, cloned or removed outside the GUI, e.g. from a terminal
+            self._datasets_changed()
 
         level, parts, parentds_path = self._dm_current_level()
         root, project, campaign, experiment, category = parts
@@ -1085,57 +1480,60 @@ class MainWindow(QMainWindow):
         self.lbl_category.setText(f'Category: {category}')
 
         if self.dm is None or self.dm_current_path is None:
-            self.dm_list.clear()
+            self._shown_listing = None
+            self.dm_model.clear()
             return
 
         # enable/disable “new dataset” by level
         self.btn_new_dataset.setEnabled(experiment == "")
         self.btn_up.setEnabled(project != "")
 
-        # list children of current path
-        # list children of current path
-        self.dm_list.clear()
-        for child in self.dm_current_path.expanduser().resolve().iterdir():
-            # still skip dot dirs/files
-            if child.name.startswith("."):
-                continue
+        try:
+            st = os.stat(self.dm_current_path)
+            listing = (self.dm_current_path, st.st_ino, st.st_mtime_ns)
+        except OSError:
+            listing = None
+        if not force and listing is not None and listing == self._shown_listing:
+            return
+        self._shown_listing = listing
+        # halt previous branch check not yet started; only after the unchanged-listing return above, as the check is
+        # rescheduled by _dm_populate_list alone
+        self._check_branch_timer.stop()
 
-            kind = self._dm_classify_entry(child)
-            is_gitignored = dgapi.is_gitignored(parentds_path, child)
-            rel_path = child.relative_to(parentds_path)
-
-            item = QListWidgetItem(child.name)
-            item.setData(Qt.ItemDataRole.UserRole, str(child))
-            item.setData(Qt.ItemDataRole.UserRole + 1, child.name)
-            item.setData(Qt.ItemDataRole.UserRole + 2, False)  # flag whether listed in parentds_path/.gitignore
-            item.setData(Qt.ItemDataRole.UserRole + 3, rel_path)
-
-            # color-code
-            if is_gitignored:
-                item.setForeground(QColor("red"))
-                item.setToolTip("Ignored by dataset .gitignore")
-            elif kind == "dataset":
-                item.setForeground(QColor("#1f6feb"))  # blue-ish
-                item.setToolTip("Dataset (DataLad/Git)")
-            elif kind == "folder":
-                item.setForeground(QColor("#237804"))  # green
-                item.setToolTip("Folder")
-            elif kind == "file-local":
-                item.setForeground(QColor("#000000"))  # black
-                item.setToolTip("Local file")
-            elif kind == "file-remote":
-                item.setForeground(QColor("#808080"))  # grey
-                item.setToolTip("Remotely available (annex), content not present")
-                # a little visual hint
-                font = item.font()
-                font.setItalic(True)
-                item.setFont(font)
-            else:
-                item.setForeground(QColor("#555555"))
-                item.setToolTip("Other")
+        # list children of current path: scanned in a worker, applied by _dm_populate_list
+        self._scan_gen += 1
+        gen = self._scan_gen
+        scan = self._listing_cache.get(listing) if listing is not None else None
+        if scan is not None:
+            self._listing_cache.move_to_end(listing)
+            self._dm_populate_list(gen, *scan)
+            return
 
-            self.dm_list.addItem(item)
-        self._dm_check_branch_scheduler()
+        def _scanned(scan: tuple[DMRows, dict[str, Path]]):
+            # scans superseded by another one may predate a forced refresh and are not cached
+            if listing is not None and gen == self._scan_gen:
+                self._listing_cache[listing] = scan
+                if len(self._listing_cache) > _LISTING_CACHE_SIZE:
+                    self._listing_cache.popitem(last=False)
+            self._dm_populate_list(gen, *scan)
+
+        def _scan_failed(_exc):
+            # e.g. a PermissionError from scandir; the error itself is logged by _on_worker_error
+            if gen != self._scan_gen:
+                return
+            # not taken as unchanged by the next refresh, which lists the directory again
+            self._shown_listing = None
+            self.dm_model.set_placeholder("Could not list this folder, see the log")
+
+        self.dm_model.set_placeholder("Loading…")
+        self._run_in_worker(
+            self._dm_scan_dir,
+            None,
+            self.dm_current_path,
+            parentds_path,
+            on_done=_scanned,
+            on_error=_scan_failed,
+        )
 
     def dm_save_branch(self):
         """
@@ -1163,11 +1561,14 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "No datamanager", "Select or create_dataset a datamanager first.")
             return
 
-        item = self.dm_list.currentItem()
-        target_path = Path(item.data(Qt.ItemDataRole.UserRole)) if item else self.dm_current_path
+        path_str = self.dm_list.currentIndex().data(DMListModel.PathRole)
+        target_path = Path(path_str) if path_str else self.dm_current_path
 
-        ds_root, rel = dgapi.find_dataset_root_and_rel(target_path)
-        if ds_root is None or rel is None:
+        # a newer selection supersedes metadata still being loaded
+        self._meta_gen += 1
+        gen = self._meta_gen
+        ds_root, rel = self._find_dataset_root_and_rel(target_path)
+        if ds_root is None:
             self.meta_title.setText("Metadata: —")
             self.metadata_update_viewer("No enclosing dataset found for this selection.")
             self.meta_current_ds_root = None
@@ -1175,22 +1576,49 @@ class MainWindow(QMainWindow):
             self.meta_current_payload = None
             return
 
-        try:
-            payload = self.dm.load_meta(ds_path=ds_root, path=rel)
-        except ValueError as e:
+        cache_key = (str(ds_root), None if rel is None else rel.as_posix())
+        payload = self._meta_cache_get(cache_key)
+        if payload is not None:
+            self._meta_show(target_path, ds_root, rel, payload)
+            return
+
+        def _loaded(loaded: dict):
+            # a superseded load may have been overtaken by a metadata save, and is neither cached nor shown
+            if gen == self._meta_gen:
+                self._meta_cache_put(cache_key, loaded)
+                self._meta_show(target_path, ds_root, rel, loaded)
+
+        def _failed(exc: BaseException):
+            if gen != self._meta_gen:
+                return
             self.meta_title.setText(f"Metadata: {target_path.name}")
-            self.metadata_update_viewer(f"Error while reading metadata:\n{e}")
+            self.metadata_update_viewer(f"Error while reading metadata:\n{exc}")
             self.meta_current_ds_root = None
             self.meta_current_rel = None
             self.meta_current_payload = None
-            return
 
+        # metadata.json holds the records of the entire dataset and is parsed in a worker
+        self.meta_current_ds_root = None
+        self.meta_current_rel = None
+        self.meta_current_payload = None
+        self.metadata_update_viewer("Loading…")
+        self._run_in_worker(self.dm.load_meta, None, ds_path=ds_root, path=rel, on_done=_loaded, on_error=_failed)
+
+    def _meta_show(self, target_path: Path, ds_root: Path, rel: Path | None, payload: dict):
+        """
+        Shows a metadata payload in the metadata panel and makes it the one edited.
+        :param target_path: (Path) the selected item
+        :param ds_root: (Path) dataset root of the item
+        :param rel: (Path | None) path of the item relative to ds_root, None for the dataset itself
+        :param payload: (dict) the payload as returned by DataManager.load_meta
+        :return: no return value
+        """
         self.meta_current_ds_root = ds_root
-        self.meta_current_rel = rel.as_posix()
+        self.meta_current_rel = None if rel is None else rel.as_posix()
         # if nothing yet, start from empty dict to allow adding
         self.meta_current_payload = dict(payload) if payload else {}
 
-        title_name = target_path.name if rel else f"{ds_root.name} (dataset)"
+        title_name = target_path.name if rel is not None else f"{ds_root.name} (dataset)"
         self.meta_title.setText(f"Metadata: {title_name}")
 
         if self.meta_current_payload:
@@ -1198,10 +1626,35 @@ class MainWindow(QMainWindow):
         else:
             self.metadata_update_viewer("No metadata found. You can add fields below.")
 
+    def _meta_cache_get(self, key: tuple[str, str | None]) -> dict | None:
+        """
+        Returns a copy of the cached metadata payload for key, or None if it is not cached.
+        :param key: (tuple[str, str | None]) dataset root and relative posix path (None for the dataset itself)
+        :return: (dict | None) the payload
+        """
+        payload = self._meta_cache.get(key)
+        if payload is None:
+            return None
+        self._meta_cache.move_to_end(key)
+        return dict(payload)
+
+    def _meta_cache_put(self, key: tuple[str, str | None], payload: dict):
+        """
+        Caches a copy of a metadata payload, evicting the least recently used entry beyond _META_CACHE_SIZE.
+        :param key: (tuple[str, str | None]) dataset root and relative posix path (None for the dataset itself)
+        :param payload: (dict) the payload as returned by DataManager.load_meta
+        :return: no return value
+        """
+        self._meta_cache[key] = dict(payload) if payload else {}
+        self._meta_cache.move_to_end(key)
+        if len(self._meta_cache) > _META_CACHE_SIZE:
+            self._meta_cache.popitem(last=False)
+
     def dm_remove_selected(self, reckless=False):
         paths = self._selected_dm_paths()
         if not paths:
             return
+        self._datasets_changed()
 
         # confirmation
         names = "\n".join(str(p) for p in paths)
@@ -1226,21 +1679,13 @@ class MainWindow(QMainWindow):
         if ret != QMessageBox.StandardButton.Yes:
             return
 
-        for ds_root, rel_str in paths:
-            p = str(ds_root) + ':' + str(rel_str)
-            try:
-                self._run_in_worker(
-                    self.dm.remove_from_tree,
-                    dataset=str(ds_root),
-                    path=rel_str,
-                    recursive=True,
-                    reckless=reckless_flag
-                )
-                self.logviewer_append_text(f"[INFO] Removed dataset: {p}\n")
-            except Exception as e:
-                self.logviewer_append_text(f"[WARN] Could not remove {p}: {e}\n")
-
-        self.dm_refresh_panel()
+        # one worker (and one datalad call) per dataset
+        jobs = [
+            (str(ds_root) + ':' + ', '.join(rel_strs), self.dm.remove_from_tree,
+             dict(dataset=str(ds_root), path=rel_strs, recursive=True, reckless=reckless_flag))
+            for ds_root, rel_strs in self._group_by_dataset(paths).items()
+        ]
+        self._run_batch(jobs, done_text="Removed dataset", fail_text="remove")
 
     def dm_update_from_remote(self):
         paths = self._selected_dm_paths()
@@ -1348,6 +1793,9 @@ class MainWindow(QMainWindow):
             )
             return
 
+        # one item per selected source
+        items: list[InstallSpec] = []
+
         # ----- CASE 1: we are EXACTLY at experiment: root / proj / camp / exp
         if level == "experiment":
             # ask user for category
@@ -1355,56 +1803,138 @@ class MainWindow(QMainWindow):
                 self,
                 "Select category",
                 f"Install into experiment “{experiment}” under which category?",
-                ALLOWED_CATEGORIES,
+                list(dmm.ALLOWED_CATEGORIES_ORDER),
                 0,
                 False
             )
             if not ok:
                 return
 
-            for src in sources:
-                try:
-                    self._run_in_worker(
-                        self.dm.install_into_tree,
-                        source=src,
-                        project=project,
-                        campaign=campaign,
-                        experiment=experiment,
-                        category=category,
-                        metadata={"installed_by_gui": True},
-                    )
-                except Exception as e:
-                    QMessageBox.critical(self, "Install failed", f"Could not install {src}:\n{e}")
+            items = [
+                dmm.InstallSpec(source=src, project=project, campaign=campaign, experiment=experiment,
+                                category=category, metadata={"installed_by_gui": True})
+                for src in sources
+            ]
 
         elif level == "category":
-            for src in sources:
-                try:
-                    cat_path = Path(root_dir) / Path(project) / Path(campaign) / Path(experiment) / Path(category)
-                    dm_path = Path(self.dm_current_path)
-                    dest_rel = dm_path.relative_to(cat_path)
-                    self._run_in_worker(
-                        self.dm.install_into_tree,
-                        source=src,
-                        project=project,
-                        campaign=campaign,
-                        experiment=experiment,
-                        category=category,
-                        dest_rel=dest_rel,
-                        metadata={"installed_by_gui": True},
-                    )
-                except Exception as e:
-                    QMessageBox.critical(self, "Install failed", f"Could not install {src}:\n{e}")
-                    # continue
+            # the destination is the same for all sources
+            cat_path = Path(root_dir, project, campaign, experiment, category)
+            try:
+                dest_rel = Path(self.dm_current_path).relative_to(cat_path)
+            except ValueError as e:
+                QMessageBox.critical(self, "Install failed", f"Could not install into {self.dm_current_path}:\n{e}")
+                return
+            items = [
+                dmm.InstallSpec(source=src, project=project, campaign=campaign, experiment=experiment,
+                                category=category, dest_rel=dest_rel, metadata={"installed_by_gui": True})
+                for src in sources
+            ]
 
-        self._dm_set_current_path_stale(include_parents=True)
-        self.dm_refresh_panel()
-        self.status.showMessage("Installed into subfolder of experiment.")
+        if items:
+            self._install_sources(items)
+
+    def _install_sources(self, items: list[InstallSpec]):
+        """
+        Runs DataManager.install_many for all items in one worker, so that the experiment dataset is saved once for
+        all of them rather than by concurrent per-item saves. Shows a busy dialog, refreshes the panel when the
+        installs have finished and then reports all failures together.
+        :param items: (list[InstallSpec]) the items to install
+        :return: no return value
+        """
+        total = len(items)
+        # busy indicator; the items are installed in a single call
+        progress = QProgressDialog("Installing into datamanager…", None, 0, 0, self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        # only shown if the installs take a while
+        progress.setMinimumDuration(500)
+        progress.setValue(0)
+        failed_items: list[tuple[InstallSpec, BaseException]] = []
+
+        def _finished(batch_failed: list[tuple[str, BaseException]]):
+            progress.close()
+            # an exception of install_many itself, e.g. from the final save, fails the batch as a whole
+            failed = [(str(spec.source), exc) for spec, exc in failed_items] + batch_failed
+            self._dm_set_current_path_stale(include_parents=True)
+            if failed:
+                # one dialog for all failures; the per-source messages go into the expandable details, so that a
+                # large failed batch does not produce an oversized dialog
+                mb = QMessageBox(QMessageBox.Icon.Critical, "Install failed",
+                                 f"Could not install {len(failed)} of {total} items.", parent=self)
+                mb.setDetailedText("\n".join(f"{src}: {exc}" for src, exc in failed))
+                mb.exec()
+            else:
+                self.status.showMessage(f"Installed {total} item(s) into the datamanager.")
+
+        self._run_batch(
+            [(f"{total} item(s)", self.dm.install_many, dict(items=items, failed=failed_items))],
+            on_finished=_finished,
+        )
+
+    def _run_batch(self, jobs: list[tuple[str, callable, dict]], *, done_text: str | None = None,
+                   fail_text: str | None = None, on_progress=None, on_finished=None):
+        """
+        Runs fn(**kwargs) for all jobs concurrently in workers and refreshes the datamanager panel once, after the
+        last job has finished, so that the panel shows the state after all of them.
+        :param jobs: (list[tuple[str, callable, dict]]) label, function and keyword arguments per job
+        :param done_text: (str | None) if given, each successful job is logged as "<done_text>: <label>"
+        :param fail_text: (str | None) if given, each failed job is logged as "Could not <fail_text> <label>"
+        :param on_progress: (callable | None) called with the number of finished jobs after each job
+        :param on_finished: (callable | None) called after the refresh with the (label, exception) of failed jobs
+        :return: no return value
+        """
+        if not jobs:
+            return
+        remaining = len(jobs)
+        failed: list[tuple[str, BaseException]] = []
+
+        def _one_finished(label: str, exc: BaseException | None = None):
+            nonlocal remaining
+            remaining -= 1
+            if exc is None:
+                if done_text:
+                    self.logviewer_append_text(f"[INFO] {done_text}: {label}\n")
+            else:
+                failed.append((label, exc))
+                if fail_text:
+                    self.logviewer_append_text(f"[WARN] Could not {fail_text} {label}: {exc}\n")
+            if on_progress is not None:
+                on_progress(len(jobs) - remaining)
+            if remaining:
+                return
+            # the jobs may have created or removed datasets
+            self._datasets_changed()
+            self.dm_refresh_panel(force=True)
+            if on_finished is not None:
+                on_finished(failed)
+
+        for label, fn, kwargs in jobs:
+            self._run_in_worker(
+                fn,
+                refresh=None,
+                on_done=lambda _out, label=label: _one_finished(label),
+                on_error=lambda exc, label=label: _one_finished(label, exc),
+                **kwargs,
+            )
 
     def logviewer_append_text(self, text):
-        if 'INFO' in text and 'progress bar' in text:
-            # ignore progress bar messages
+        if 'progress bar' in text:
+            # ignore progress bar messages; text may hold a batch of lines
+            text = ''.join(line for line in text.splitlines(keepends=True)
+                           if not ('INFO' in line and 'progress bar' in line))
+            if not text:
+                return
+        self._log_buf.append(text)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(50, self._logviewer_flush)
+
+    def _logviewer_flush(self):
+        buf, self._log_buf = self._log_buf, []
+        self._log_flush_pending = False
+        if not buf:
             return
-        self.log_view.insertPlainText(text)
+        # one append (one layout pass) for everything collected since the last flush
+        self.log_view.appendPlainText(''.join(buf).rstrip('\n'))
         self.log_view.verticalScrollBar().setValue(
             self.log_view.verticalScrollBar().maximum())  # Scroll to bottom
 
@@ -1429,12 +1959,14 @@ class MainWindow(QMainWindow):
             url = dlg.hostname()
             repo = default_repo
             username = dlg.username()
-            # Store to config
+            # Store to config, unless accepted without a change
             if self.dm is not None:
-                setattr(self.dm.cfg, "GIN_url", url)
-                setattr(self.dm.cfg, "GIN_repo", repo)
-                setattr(self.dm.cfg, "GIN_user", username)
-                self.dm.save_current_dm_configuration()
+                cfg = self.dm.cfg
+                if (cfg.GIN_url, cfg.GIN_repo, cfg.GIN_user) != (url, repo, username):
+                    setattr(cfg, "GIN_url", url)
+                    setattr(cfg, "GIN_repo", repo)
+                    setattr(cfg, "GIN_user", username)
+                    self.dm.save_current_dm_configuration()
             self.status.showMessage(f"GIN remote set to: {url}", 5000)
 
     def select_root(self, first_time: bool = False):
@@ -1443,7 +1975,7 @@ class MainWindow(QMainWindow):
         :param first_time: (bool) GUI startup?
         :return: no return value
         """
-        path = QFileDialog.getExistingDirectory(self, "Choose datamanager root")
+        path = self._get_existing_directory("Choose datamanager root")
         if not path:
             if first_time:
                 QMessageBox.critical(self, "No root selected",
@@ -1452,16 +1984,56 @@ class MainWindow(QMainWindow):
 
         # IMPORTANT: we re-create_dataset the DataManager with the new root.
         # It will merge with persisted values (user_name, user_email, etc.)
-        try:
-            dm = DataManager(root=path)
-        except RuntimeError:
+        self._load_datamanager(path)
+
+    def _load_datamanager(self, path: str, **identity):
+        """
+        Creates the DataManager for root path in a worker, as probing the datasets can take long on network file
+        systems, and shows a busy dialog meanwhile. Asks for user name and email if the root has no persisted
+        identity, then tries again.
+        :param path: (str) datamanager root
+        :param identity: user_name and user_email, if already asked for
+        :return: no return value
+        """
+        progress = QProgressDialog("Loading datamanager…", None, 0, 0, self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+
+        def _loaded(dm: DataManager | None):
+            progress.close()
+            if dm is not None:
+                self.set_datamanager(dm)
+                return
             dlg = FirstRunDialog(self)
             if dlg.exec() == QDialog.DialogCode.Accepted:
                 name, email = dlg.get_values()
-                dm = DataManager(root=path, user_name=name, user_email=email)
-            else:
-                return
-        self.set_datamanager(dm)
+                self._load_datamanager(path, user_name=name, user_email=email)
+
+        def _failed(exc: BaseException):
+            progress.close()
+            QMessageBox.critical(self, "Loading failed", f"Could not load the datamanager at {path}:\n{exc}")
+
+        self._run_in_worker(
+            self._create_datamanager,
+            refresh=None,
+            path=path,
+            on_done=_loaded,
+            on_error=_failed,
+            **identity,
+        )
+
+    @staticmethod
+    def _create_datamanager(path: str, **identity) -> DataManager | None:
+        """
+        Runs in a worker thread.
+        :return: (DataManager | None) the datamanager, or None if user name and email are required first
+        """
+        try:
+            return dmm.DataManager(root=path, **identity)
+        except RuntimeError:
+            if identity:
+                raise
+            return None
 
 
     def metadata_save_changes(self):
@@ -1487,10 +2059,16 @@ class MainWindow(QMainWindow):
         # optional: use 'name' from payload if present
         name = extra.get("name")
 
+        def _saved(payload: dict):
+            # save_meta returns what load_meta would read back, so the viewer reloads from the cache
+            self._meta_cache_put((str(ds_root), rel), payload)
+            self.dm_show_selected_metadata()
+
         try:
             self._run_in_worker(
                 self.dm.save_meta,
-                refresh='mt',
+                refresh=None,
+                on_done=_saved,
                 ds_path=ds_root,
                 path=rel,
                 name=name,
@@ -1499,45 +2077,86 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Save failed", f"Could not save_dataset metadata:\n{e}")
 
-    def metadata_update_viewer(self, message: str = None):
+    def metadata_update_viewer(self, message: str = None, key: str | None = None):
         """
         Update the metadata viewer with current in-memory metadata.
+        :param message: (str | None) text to show instead of the metadata
+        :param key: (str | None) if given, only this top-level key changed since the last update and only its entry
+                    is serialized again
         :return: no return value
         """
         if message is not None:
+            self._meta_blocks = {}
             self.meta_view.setPlainText(message)
             return
 
         meta = self.meta_current_payload
         if meta is None:
             return
-        _ = meta.pop("@context", None)
-        _ = meta.pop("@id", None)
-        _ = meta.pop("@type", None)
-        self.meta_view.setPlainText(json.dumps(meta, indent=4, ensure_ascii=False))
+        for hidden in ("@context", "@id", "@type"):
+            meta.pop(hidden, None)
+            self._meta_blocks.pop(hidden, None)
+        if key is None:
+            self._meta_blocks = {k: self._meta_block(k, v) for k, v in meta.items()}
+        else:
+            self._meta_blocks[key] = self._meta_block(key, meta[key])
+        if not self._meta_blocks:
+            self.meta_view.setPlainText("{}")
+            return
+        # same text as serializing the whole payload, as the blocks are kept in payload order
+        self.meta_view.setPlainText("{\n" + ",\n".join(self._meta_blocks.values()) + "\n}")
+
+    @staticmethod
+    def _meta_block(key: str, value) -> str:
+        """
+        Pretty-prints a single top-level entry of the metadata payload as it appears inside the enclosing braces.
+        :param key: (str) top-level key
+        :param value: JSON-serializable value
+        :return: (str) the indented '"key": value' lines without a trailing comma
+        """
+        # strip the "{\n" and "\n}" around the single entry
+        return _dumps({key: value})[2:-2]
 
     def set_datamanager(self, dm: DataManager):
         self.dm = dm
+        # the file browser is set up before the datamanager is loaded, see _populate_fs_panel
+        if self.fs_model is not None:
+            self._set_fs_model(dm.cfg.use_qt_file_system_model)
         self.dm_current_path = Path(dm.cfg.dm_root)  # start at root
         self.status.showMessage(
             f"Using datamanager at {self.dm.cfg.dm_root} as {self.dm.cfg.user_name} <{self.dm.cfg.user_email}>"
         )
-        self.dm_refresh_panel()
+        self.dm_refresh_panel(force=True)
 
     def sync_with_gin(self, recursive=True):
-        if self.dm is None:
+        if self.dm is None or self._sync_running:
             return
-        # simple pull
-        dgapi.pull_from_remotes(dataset=self.dm.cfg.dm_root, recursive=recursive)
-        self.status.showMessage("Pulled from GIN.")
+        self._sync_running = True
+        self.status.showMessage("Pulling from GIN…")
+
+        def _finished(_out=None):
+            self._sync_running = False
+            self.status.showMessage("Pulled from GIN.")
+
+        def _failed(_exc):
+            self._sync_running = False
+            self.status.showMessage("Pull from GIN failed.")
+
+        # simple pull, in a worker as it takes a network round trip per dataset
+        self._run_in_worker(
+            dgapi.pull_from_remotes,
+            refresh='dm',
+            dataset=self.dm.cfg.dm_root,
+            recursive=recursive,
+            on_done=_finished,
+            on_error=_failed,
+        )
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
 
     app.setStyle("Fusion")
-    # Create a light palette
-    light_palette = QPalette()
     app.setPalette(create_light_palette())
 
     w = MainWindow()
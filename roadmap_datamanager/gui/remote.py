@@ -10,6 +10,9 @@ from PySide6.QtWidgets import (
 from roadmap_datamanager import datalad_gin_api as dgapi
 
 class GinRemoteDialog(QDialog):
+    # GIN user names; compiled once and shared by all dialogs
+    _USER_RX = QRegularExpression(r"^[A-Za-z0-9._-]+$")
+
     def __init__(self,
                  parent=None,
                  *,
@@ -27,6 +30,7 @@ class GinRemoteDialog(QDialog):
 
         self.user_edit = QLineEdit(self)
         self.user_edit.setPlaceholderText("e.g. your-gin-username")
+        self.user_edit.setValidator(QRegularExpressionValidator(self._USER_RX, self))
         self.user_edit.setText(default_user)
 
         self.hostname_edit = QLineEdit(self)
@@ -102,8 +106,7 @@ class GinRemoteDialog(QDialog):
             return ""
         return f"git@{hostname}:{user}/{repo}.git"
 
-    def _build_preview_text(self) -> str:
-        remote_url = self._build_url()
+    def _build_preview_text(self, remote_url: str) -> str:
         if not remote_url:
             return ""
         host_alias = self.host_alias_edit.text().strip()
@@ -130,7 +133,7 @@ class GinRemoteDialog(QDialog):
         self._update_state()
 
     def _update_state(self):
-        preview_text = self._build_preview_text()
+        preview_text = self._build_preview_text(self._build_url())
         self.preview.setText(preview_text if preview_text else "—")
 
         user = self.username()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import json
 from pathlib import Path
 
@@ -9,6 +10,14 @@ from roadmap_datamanager.datalad_utils import ensure_paths, get_dataset_version
 from datetime import datetime, timezone
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# record fields that change on every add(), without a change of the metadata itself
+_VOLATILE_FIELDS = ('extraction_time', 'dataset_version')
+
 
 class Metadata:
     def __init__(self,
@@ -22,16 +31,20 @@ class Metadata:
         """
         self.ds_root, self.path, self.absolute_path, self.relposix = ensure_paths(ds_root, path)
         self.metapath = self.ds_root / 'metadata.json'
-        if self.metapath.is_file():
-            self.meta = json.loads(self.metapath.read_text())
-        else:
+        try:
+            payload = self.metapath.read_bytes()
+        except FileNotFoundError:
             self.meta = {}
+        else:
+            # orjson parses several times faster, if installed. It is not used for writing, as it only supports an
+            # indentation of two spaces, which would reformat every existing metadata.json on its next save.
+            self.meta = orjson.loads(payload) if orjson is not None else json.loads(payload)
 
         self.path_key = self.relposix
         self.ds = Dataset(self.ds_root)
 
     def save(self):
-        self.metapath.write_text(json.dumps(self.meta, indent=4))
+        self.metapath.write_bytes(json.dumps(self.meta, indent=4).encode('utf-8'))
 
     def add(self,
             payload: dict,
@@ -41,7 +54,7 @@ class Metadata:
             extractor_name: str | None = None,
             extractor_version: str | None = None,
             name: str | None = None,
-            dataset_type: str = 'below-experiment'):
+            dataset_type: str = 'below-experiment') -> bool:
         """
         Add a metadata dictionaray to the class
         :param payload: (dict) The metadata dictionary
@@ -54,8 +67,9 @@ class Metadata:
         :param dataset_type: (str) Designates the type of dataset. Options: 'root', 'project', 'campaign', 'experiment',
                                    or 'below experiment'. Content 'below experiment' is not a dataset, but files and
                                    folders that belong to an experiment dataset
-        :return: no return value
+        :return: (bool) whether the record changed, apart from its extraction time and dataset version
         """
+        previous = self._comparable(self.meta.get(self.path_key))
         dataset_id = self.ds.id
         dataset_version = get_dataset_version(self.ds)
         extraction_time = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
@@ -124,6 +138,19 @@ class Metadata:
             self.meta[self.path_key] = self.meta[self.path_key].update(record)
             self.meta[self.path_key]['extracted_metadata'] = new_em
 
+        return previous is None or previous != self._comparable(self.meta[self.path_key])
+
+    @staticmethod
+    def _comparable(record: dict | None) -> dict | None:
+        """
+        Copy of a record without the fields that change on every add().
+        :param record: (dict | None) metadata record
+        :return: (dict | None) the copy, None if record is None
+        """
+        if record is None:
+            return None
+        return {key: copy.deepcopy(value) for key, value in record.items() if key not in _VOLATILE_FIELDS}
+
     def get(self, mode='envelope'):
         """
         Get a metadata dictionary for the file references in self.path/self.relposix/self.path_key.
@@ -0,0 +1,59 @@
+import json
+import os
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from roadmap_datamanager.configuration import DataManagerConfig, load_persistent_cfg, save_persistent_cfg
+
+
+class DataManagerConfigTest(unittest.TestCase):
+    def setUp(self):
+        self.config_path = Path(tempfile.mkdtemp()) / "dm.json"
+        self._old_env = os.environ.get(DataManagerConfig.CONFIG_ENV_VAR)
+        os.environ[DataManagerConfig.CONFIG_ENV_VAR] = str(self.config_path)
+
+    def tearDown(self):
+        if self._old_env is None:
+            os.environ.pop(DataManagerConfig.CONFIG_ENV_VAR, None)
+        else:
+            os.environ[DataManagerConfig.CONFIG_ENV_VAR] = self._old_env
+
+    def test_config_is_slotted(self):
+        cfg = DataManagerConfig(user_name="Frank Heinrich")
+        with self.assertRaises(AttributeError):
+            _ = cfg.__dict__
+
+    def test_save_and_load_roundtrip(self):
+        save_persistent_cfg(DataManagerConfig(user_name="Frank Heinrich", dm_root="/tmp/dm"))
+        cfg = load_persistent_cfg()
+        self.assertEqual(cfg.user_name, "Frank Heinrich")
+        self.assertEqual(cfg.dm_root, "/tmp/dm")
+
+    def test_save_skips_unchanged_content(self):
+        cfg = DataManagerConfig(user_name="Frank Heinrich")
+        save_persistent_cfg(cfg)
+        mtime_ns = self.config_path.stat().st_mtime_ns
+        inode = self.config_path.stat().st_ino
+        save_persistent_cfg(cfg)
+        self.assertEqual(self.config_path.stat().st_mtime_ns, mtime_ns)
+        self.assertEqual(self.config_path.stat().st_ino, inode)
+        self.assertFalse(self.config_path.with_suffix(".json.tmp").exists())
+
+    def test_load_sees_external_changes(self):
+        save_persistent_cfg(DataManagerConfig(user_name="Frank Heinrich"))
+        self.assertEqual(load_persistent_cfg().user_name, "Frank Heinrich")
+        data = json.loads(self.config_path.read_text())
+        data["user_name"] = "Someone Else"
+        self.config_path.write_text(json.dumps(data))
+        self.assertEqual(load_persistent_cfg().user_name, "Someone Else")
+
+    def test_load_falls_back_to_defaults_for_unreadable_file(self):
+        for content in (b"", b"  \n", b'{"user_name": "Frank'):
+            self.config_path.write_bytes(content)
+            self.assertEqual(load_persistent_cfg().user_name, DataManagerConfig().user_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
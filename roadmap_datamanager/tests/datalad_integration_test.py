@@ -7,9 +7,10 @@ import unittest
 import uuid
 
 from pathlib import Path, PurePosixPath
+from unittest import mock
 
 import datalad_utils
-from roadmap_datamanager.datamanager import DataManager
+from roadmap_datamanager.datamanager import DataManager, _copy_file
 from roadmap_datamanager import datalad_gin_api as dgapi
 from roadmap_datamanager.metadata import Metadata
 
@@ -137,6 +138,21 @@ class DataManagerInitTreeTest(unittest.TestCase):
         self.assertTrue(has_meta(cp, rel_path=Path(), node_type='campaign'))
         self.assertTrue(has_meta(ep, rel_path=Path(), node_type='experiment'))
 
+    def test_save_meta_unchanged_makes_no_commit(self):
+        dm, root = create_tmp_dm_instance()
+        ep = dm.init_tree(project="roadmap", campaign="2025_summer", experiment="NR1_0")
+
+        dm.save_meta(ep, dataset_type='experiment', extra={"sample": "A"})
+        head = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=ep, text=True)
+
+        # same payload again: neither metadata.json nor the dataset history change
+        dm.save_meta(ep, dataset_type='experiment', extra={"sample": "A"})
+        self.assertEqual(head, subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=ep, text=True))
+
+        # a changed payload is committed
+        dm.save_meta(ep, dataset_type='experiment', extra={"sample": "B"})
+        self.assertNotEqual(head, subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=ep, text=True))
+
 
 @unittest.skipUnless(ENV_READY, "Environment check failed; see TestEnvironment.test_000_requirements_present")
 class DataManagerInstallIntoTreeTest(unittest.TestCase):
@@ -172,6 +188,39 @@ class DataManagerInstallIntoTreeTest(unittest.TestCase):
         dest = cat / src.name
         self.assertTrue(has_meta(ep, rel_path=dest.relative_to(ep), node_type="below-experiment"))
 
+    def test_installed_file_matches_source(self):
+        dm, root = create_tmp_dm_instance()
+        dm.init_tree(project="roadmap", campaign="2025_summer", experiment="NR1_0")
+        cat = root / "roadmap" / "2025_summer" / "NR1_0" / "raw"
+
+        # binary payload of a few MB, compared byte for byte after the install
+        payload = os.urandom(3 * 1024 * 1024 + 17)
+        src = root / "payload.bin"
+        src.write_bytes(payload)
+
+        dm.install_into_tree(
+            source=src,
+            project="roadmap",
+            campaign="2025_summer",
+            experiment="NR1_0",
+            category="raw",
+        )
+
+        self.assertEqual((cat / "payload.bin").read_bytes(), payload, "installed file differs from source")
+
+    def test_copy_falls_back_when_copy_file_range_copies_nothing(self):
+        if not hasattr(os, "copy_file_range"):
+            self.skipTest("os.copy_file_range not available")
+        _, root = create_tmp_dm_instance()
+        src = mk_temp_file(root, "src.txt", "abc123")
+        dst = root / "dst.txt"
+
+        # some file systems report an unsupported copy_file_range by copying 0 bytes
+        with mock.patch("os.copy_file_range", return_value=0):
+            _copy_file(str(src), str(dst))
+
+        self.assertEqual(dst.read_text(), "abc123")
+
     def test_install_folder_recursively_as_subfolders(self):
         dm, root = create_tmp_dm_instance()
         dm.init_tree(project="roadmap", campaign="2025_summer", experiment="NR1_0")
@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from types import SimpleNamespace
+
+# no display needed
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# the GUI modules import each other as top-level modules, like when gui.py is run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "gui"))
+
+try:
+    from PySide6.QtWidgets import QApplication, QFileSystemModel
+    from core import GenericIconProvider, LazyDirModel
+    from gui import MainWindow
+    GUI_ERROR = None
+except ImportError as e:
+    GUI_ERROR = f"GUI not importable: {e}"
+
+
+def fake_datamanager(root: Path, use_qt_file_system_model: bool):
+    """
+    Stands in for a DataManager in MainWindow.set_datamanager, which only reads the configuration
+    :param root: (Path) datamanager root directory
+    :param use_qt_file_system_model: (bool) the configuration setting
+    :return: object with a cfg attribute like DataManager
+    """
+    cfg = SimpleNamespace(
+        dm_root=str(root),
+        user_name="Frank Heinrich",
+        user_email="fheinrich@cmu.edu",
+        use_qt_file_system_model=use_qt_file_system_model,
+    )
+    return SimpleNamespace(cfg=cfg)
+
+
+@unittest.skipIf(GUI_ERROR, GUI_ERROR)
+class FileBrowserModelTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.window = MainWindow()
+        # normally run from the event loop, before the datamanager is loaded
+        self.window._populate_fs_panel()
+        self.browse_root = tempfile.mkdtemp()
+        self.window._set_fs_root(self.browse_root)
+
+    def tearDown(self):
+        self.window.close()
+
+    def test_lazy_model_before_datamanager(self):
+        self.assertIsInstance(self.window.fs_model, LazyDirModel)
+
+    def test_setting_switches_model(self):
+        root = Path(tempfile.mkdtemp())
+
+        self.window.set_datamanager(fake_datamanager(root, use_qt_file_system_model=True))
+        self.assertIsInstance(self.window.fs_model, QFileSystemModel)
+        self.assertIs(self.window.fs_tree.model(), self.window.fs_model)
+        self.assertEqual(Path(self.window.fs_model.rootPath()), Path(self.browse_root))
+
+        self.window.set_datamanager(fake_datamanager(root, use_qt_file_system_model=False))
+        self.assertIsInstance(self.window.fs_model, LazyDirModel)
+        self.assertIs(self.window.fs_tree.model(), self.window.fs_model)
+        self.assertEqual(Path(self.window.fs_model.rootPath()), Path(self.browse_root))
+
+    def test_qt_model_uses_generic_icons(self):
+        self.window.set_datamanager(fake_datamanager(Path(tempfile.mkdtemp()), use_qt_file_system_model=True))
+        self.assertIsInstance(self.window.fs_model.iconProvider(), GenericIconProvider)
+
+    def test_unchanged_setting_keeps_model(self):
+        model = self.window.fs_model
+        self.window.set_datamanager(fake_datamanager(Path(tempfile.mkdtemp()), use_qt_file_system_model=False))
+        self.assertIs(self.window.fs_model, model)
+
+
+if __name__ == "__main__":
+    unittest.main()